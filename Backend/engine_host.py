@@ -0,0 +1,124 @@
+# // [SYSTEM_CHECK]: GODS_EYE ENGINE HOST
+# // [CLASSIFICATION]: SHARED INFERENCE PROCESS
+# // [STATUS]: ONLINE
+
+"""
+engine_host.py - Dedicated inference process for multi-worker deployments
+The VisionEngine (camera + models) lives in exactly one process and is shared
+with every uvicorn worker through a multiprocessing manager. API workers only
+hold a proxy, so slow JSON responses never compete with capture/inference.
+"""
+
+import multiprocessing
+import os
+import secrets
+import signal
+import sys
+import time
+from multiprocessing.managers import BaseManager
+
+# // [CONFIG]: Manager endpoint (loopback only)
+ENGINE_ADDRESS = (
+    os.getenv("GODS_EYE_ENGINE_HOST", "127.0.0.1"),
+    int(os.getenv("GODS_EYE_ENGINE_PORT", "50055"))
+)
+
+# // [SECURITY]: Shared secret - manager connections carry pickles, so the key
+# // gates code execution in the host. Generated per launch unless set, and
+# // passed to the host + workers through their inherited environment
+AUTHKEY_ENV = "GODS_EYE_ENGINE_AUTHKEY"
+
+# // [CONFIG]: Set for uvicorn workers that should attach to a hosted engine
+REMOTE_ENGINE_ENV = "GODS_EYE_REMOTE_ENGINE"
+
+# // [API]: VisionEngine methods reachable through the proxy
+ENGINE_METHODS = (
+    "read_jpeg_batch",
+    "get_logs",
+    "get_status",
+    "list_faces",
+    "get_face_path",
+    "reload_faces",
+)
+
+
+class EngineManager(BaseManager):
+    """
+    // [MODULE]: EngineManager
+    // [PURPOSE]: Serve / connect to the shared VisionEngine
+    """
+
+
+_engine = None
+
+
+def _get_engine():
+    return _engine
+
+
+def _authkey() -> bytes:
+    authkey = os.getenv(AUTHKEY_ENV)
+    if not authkey:
+        raise RuntimeError(f"[CRITICAL] {AUTHKEY_ENV} is not set - launch through engine_host.start()")
+    return authkey.encode()
+
+
+def _serve(engine_kwargs: dict) -> None:
+    """
+    // [PROCESS]: Own the camera + models and serve them until terminated
+    """
+    global _engine
+    from vision_engine import VisionEngine
+
+    # // [SHUTDOWN]: Turn SIGTERM into SystemExit so cleanup runs
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    _engine = VisionEngine(**engine_kwargs)
+    EngineManager.register("get_engine", callable=_get_engine, exposed=ENGINE_METHODS)
+    server = EngineManager(address=ENGINE_ADDRESS, authkey=_authkey()).get_server()
+    print(f"[ENGINE_HOST] Serving VisionEngine on {ENGINE_ADDRESS[0]}:{ENGINE_ADDRESS[1]}")
+    try:
+        server.serve_forever()
+    finally:
+        _engine.cleanup()
+
+
+def start(**engine_kwargs) -> multiprocessing.Process:
+    """
+    // [LAUNCH]: Start the engine process and mark workers to attach to it
+    Must run before uvicorn spawns its workers so they inherit the authkey.
+    """
+    if not os.getenv(AUTHKEY_ENV):
+        os.environ[AUTHKEY_ENV] = secrets.token_bytes(32).hex()
+    
+    # // [SPAWN]: Fresh interpreter - forking after torch / numba / OpenCV have
+    # // started their thread pools is unsafe
+    process = multiprocessing.get_context("spawn").Process(
+        target=_serve, args=(engine_kwargs,), name="gods_eye_engine", daemon=True
+    )
+    process.start()
+    os.environ[REMOTE_ENGINE_ENV] = "1"
+    return process
+
+
+def is_remote() -> bool:
+    return os.getenv(REMOTE_ENGINE_ENV) == "1"
+
+
+def connect(timeout: float = 120.0):
+    """
+    // [ATTACH]: Return a proxy to the hosted VisionEngine
+    Retries while the host is still loading its models.
+    """
+    EngineManager.register("get_engine", exposed=ENGINE_METHODS)
+    authkey = _authkey()
+    deadline = time.monotonic() + timeout
+    while True:
+        manager = EngineManager(address=ENGINE_ADDRESS, authkey=authkey)
+        try:
+            manager.connect()
+            return manager.get_engine()
+        except ConnectionRefusedError:
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"[CRITICAL] Engine host unreachable at {ENGINE_ADDRESS}")
+            time.sleep(0.5)
@@ -0,0 +1,121 @@
+# // [TOOL]: YOLOv8n quantized export utility
+# // [USAGE]: python export_model.py [engine|openvino|openvino-int8|onnx|calibrate]
+
+"""
+export_model.py - Export YOLOv8n to a quantized runtime format.
+VisionEngine picks up the exported model automatically (see VisionEngine.MODEL_CANDIDATES).
+
+  engine         TensorRT INT8      -> yolov8n.engine                (NVIDIA GPU)
+  openvino       OpenVINO FP16      -> yolov8n_openvino_model/       (Intel CPU)
+  openvino-int8  OpenVINO INT8      -> yolov8n_int8_openvino_model/  (Intel CPU, AVX-512 VNNI)
+  onnx           ONNX Runtime FP32  -> yolov8n.onnx
+  calibrate      Capture INT8 calibration frames from the camera -> calib.yaml
+
+Run `calibrate` before `openvino-int8` so NNCF's post-training quantization sees
+the scene the camera actually watches; without calib.yaml ultralytics falls
+back to its coco8 sample set.
+
+OpenVINO models are exported with a static 1x3x480x640 input - VisionEngine
+runs one frame per inference on its background detector thread.
+"""
+
+import shutil
+import sys
+from pathlib import Path
+
+import cv2
+import yaml
+from ultralytics import YOLO
+
+# // [CONFIG]: Match the 640x480 camera feed (both sides are multiples of 32)
+IMGSZ = (480, 640)
+
+# // [CONFIG]: INT8 calibration set captured from the live camera
+CALIB_DIR = Path("calibration")
+CALIB_YAML = Path("calib.yaml")
+CALIB_FRAMES = 300
+CALIB_STRIDE = 5  # Keep every Nth frame so the set spans more than a few seconds
+
+
+def capture_calibration(camera_index: int = 0) -> str:
+    """
+    // [CALIBRATE]: Save CALIB_FRAMES representative camera frames + a dataset yaml
+    """
+    images = CALIB_DIR / "images"
+    shutil.rmtree(images, ignore_errors=True)
+    images.mkdir(parents=True)
+    
+    cap = cv2.VideoCapture(camera_index)
+    if not cap.isOpened():
+        raise RuntimeError(f"[CRITICAL] Could not open camera {camera_index}")
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, IMGSZ[1])
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, IMGSZ[0])
+    
+    saved = read = 0
+    try:
+        while saved < CALIB_FRAMES:
+            success, frame = cap.read()
+            if not success:
+                raise RuntimeError(f"[CRITICAL] Camera {camera_index} stopped after {saved} frames")
+            read += 1
+            if read % CALIB_STRIDE == 0:
+                cv2.imwrite(str(images / f"{saved:04d}.jpg"), frame)
+                saved += 1
+    finally:
+        cap.release()
+    
+    # // [DATASET]: Unlabelled images are enough - PTQ only needs activation ranges
+    CALIB_YAML.write_text(yaml.safe_dump({
+        "path": str(CALIB_DIR.absolute()),
+        "train": "images",
+        "val": "images",
+        "names": YOLO("yolov8n.pt").names,
+    }))
+    return str(CALIB_YAML)
+
+
+def report_int8_support() -> None:
+    """Warn when the CPU has no INT8 dot-product path (VNNI / AMX)"""
+    import openvino as ov
+    capabilities = ov.Core().get_property("CPU", "OPTIMIZATION_CAPABILITIES")
+    flags = Path("/proc/cpuinfo").read_text() if Path("/proc/cpuinfo").exists() else ""
+    if "INT8" not in capabilities:
+        print("[EXPORT] WARNING: OpenVINO reports no INT8 support on this CPU")
+    elif not any(flag in flags for flag in ("avx512_vnni", "avx_vnni", "amx_int8")):
+        print("[EXPORT] WARNING: No VNNI/AMX on this CPU - INT8 runs without dot-product kernels")
+    else:
+        print("[EXPORT] INT8 dot-product kernels (VNNI/AMX) available")
+
+
+def export(fmt: str) -> str:
+    if fmt == "calibrate":
+        return capture_calibration()
+    
+    model = YOLO("yolov8n.pt")
+    
+    if fmt == "engine":
+        return model.export(format="engine", int8=True, imgsz=IMGSZ)
+    
+    if fmt == "openvino":
+        return model.export(format="openvino", half=True, imgsz=IMGSZ)
+    
+    if fmt == "openvino-int8":
+        data = {"data": str(CALIB_YAML)} if CALIB_YAML.exists() else {}
+        path = Path(model.export(format="openvino", int8=True, imgsz=IMGSZ, **data))
+        report_int8_support()
+        target = Path("yolov8n_int8_openvino_model")
+        if path.resolve() != target.resolve():
+            shutil.rmtree(target, ignore_errors=True)
+            path.rename(target)
+        return str(target)
+    
+    if fmt == "onnx":
+        return model.export(format="onnx", imgsz=IMGSZ)
+    
+    raise ValueError(f"Unknown export format: {fmt}")
+
+
+if __name__ == "__main__":
+    fmt = sys.argv[1] if len(sys.argv) > 1 else "openvino"
+    print(f"[EXPORT] Exporting yolov8n.pt -> {fmt}...")
+    print(f"[EXPORT] Wrote {export(fmt)}")
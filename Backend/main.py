@@ -7,21 +7,63 @@ main.py - FastAPI Command Center for Mini God's Eye
 Serves MJPEG video stream and detection logs via REST API.
 """
 
+import aiofiles
+import asyncio
 import atexit
+import hashlib
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, UploadFile, File, HTTPException
+from cachetools import TTLCache
+from fastapi import BackgroundTasks, FastAPI, Request, UploadFile, File, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, JSONResponse
-import shutil
+from fastapi.responses import Response, StreamingResponse, JSONResponse
 import os
 from pathlib import Path
-from typing import List
+from typing import Callable, List
 
-from vision_engine import VisionEngine
+import engine_host
+from stream import mjpeg_stream
 
 
-# // [GLOBAL]: Vision Engine instance
-vision_engine: VisionEngine = None
+# // [GLOBAL]: Vision Engine instance (or proxy to the engine host process)
+# // vision_engine is imported lazily - proxy-only workers never load torch / models
+vision_engine = None
+
+# // [CONFIG]: Vision Engine settings
+ENGINE_CONFIG = {
+    "camera_index": 0,
+    "log_file": "detection_history.db",
+}
+
+# // [CACHE]: Short-TTL response cache for polled read endpoints
+RESPONSE_CACHE_TTL = 0.25  # seconds
+RESPONSE_CACHE_CONTROL = "max-age=1, stale-while-revalidate=2"
+response_cache: TTLCache = TTLCache(maxsize=16, ttl=RESPONSE_CACHE_TTL)
+
+# // [CONFIG]: Face uploads are streamed to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# // [CONFIG]: Upper bound for GET /logs?limit= (larger reads hit SQLite)
+LOGS_MAX_LIMIT = 5000
+
+
+async def cached_json_response(request: Request, key: tuple, build: Callable[[], dict]) -> Response:
+    """
+    // [CACHE]: Serve a JSON payload from the TTL cache, rebuilding it on miss.
+    The build runs in a worker thread (engine calls may hit SQLite or the engine
+    host), so the event loop keeps serving the MJPEG streams meanwhile.
+    Adds Cache-Control + ETag headers and answers 304 when the client's copy matches.
+    """
+    entry = response_cache.get(key)
+    if entry is None:
+        body = JSONResponse(content=await asyncio.to_thread(build)).body
+        entry = (body, f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"')
+        response_cache[key] = entry
+    
+    body, etag = entry
+    headers = {"ETag": etag, "Cache-Control": RESPONSE_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @asynccontextmanager
@@ -32,19 +74,21 @@ async def lifespan(app: FastAPI):
     """
     global vision_engine
     
-    # // [STARTUP]: Initialize Vision Engine
-    print("[GODS_EYE] Initializing Vision Engine...")
-    vision_engine = VisionEngine(
-        camera_index=0,
-        log_file="detection_history.csv"
-    )
+    # // [STARTUP]: Attach to the shared engine process, or own one in-process
+    if engine_host.is_remote():
+        print("[GODS_EYE] Attaching to Vision Engine host...")
+        vision_engine = await asyncio.to_thread(engine_host.connect)
+    else:
+        print("[GODS_EYE] Initializing Vision Engine...")
+        from vision_engine import VisionEngine
+        vision_engine = VisionEngine(**ENGINE_CONFIG)
     print("[GODS_EYE] System Online - Awaiting Targets")
     
     yield  # // [RUNTIME]: Application is running
     
-    # // [SHUTDOWN]: Cleanup resources
+    # // [SHUTDOWN]: Cleanup resources (the engine host cleans up after itself)
     print("[GODS_EYE] Initiating shutdown sequence...")
-    if vision_engine:
+    if vision_engine and not engine_host.is_remote():
         vision_engine.cleanup()
     print("[GODS_EYE] System Offline")
 
@@ -90,39 +134,51 @@ async def video_feed():
     // [ACCESS]: GET /video_feed
     // [RETURNS]: Multipart JPEG stream of processed frames
     """
+    if engine_host.is_remote():
+        stream = mjpeg_stream(vision_engine)
+    else:
+        stream = vision_engine.generate_frames()
+    
     return StreamingResponse(
-        vision_engine.generate_frames(),
+        stream,
         media_type="multipart/x-mixed-replace; boundary=frame"
     )
 
 
 @app.get("/logs")
-async def get_logs(limit: int = 50):
+async def get_logs(request: Request, limit: int = 50):
     """
     // [ROUTE]: Detection Logs
     // [ACCESS]: GET /logs?limit=50
     // [RETURNS]: JSON array of recent detection timestamps
     """
-    logs = vision_engine.get_logs(limit=limit)
-    return JSONResponse(content={
-        "status": "success",
-        "count": len(logs),
-        "logs": logs
-    })
+    limit = max(1, min(limit, LOGS_MAX_LIMIT))
+    
+    def build() -> dict:
+        logs = vision_engine.get_logs(limit=limit)
+        return {
+            "status": "success",
+            "count": len(logs),
+            "logs": logs
+        }
+    
+    return await cached_json_response(request, ("logs", limit), build)
 
 
 @app.get("/status")
-async def get_status():
+async def get_status(request: Request):
     """
     // [ROUTE]: Current Detection Status
     // [ACCESS]: GET /status
     // [RETURNS]: Current detection state
     """
-    status = vision_engine.get_status()
-    return JSONResponse(content={
-        "status": "success",
-        "data": status
-    })
+    def build() -> dict:
+        return {
+            "status": "success",
+            "data": vision_engine.get_status()
+        }
+    
+    return await cached_json_response(request, ("status",), build)
 
 
 @app.get("/faces")
@@ -132,7 +188,7 @@ async def get_faces():
     // [ACCESS]: GET /faces
     // [RETURNS]: List of registered identities
     """
-    faces = list(vision_engine.face_db.known_faces.keys())
+    faces = await asyncio.to_thread(vision_engine.list_faces)
     return JSONResponse(content={
         "status": "success",
         "count": len(faces),
@@ -140,12 +196,13 @@ async def get_faces():
     })
 
 
-@app.post("/faces")
-async def upload_face(file: UploadFile = File(...)):
+@app.post("/faces", status_code=202)
+async def upload_face(background_tasks: BackgroundTasks, file: UploadFile = File(...)):
     """
     // [ROUTE]: Upload New Face
     // [ACCESS]: POST /faces
     // [PAYLOAD]: multipart/form-data (image file)
+    // [RETURNS]: 202 - the face database reloads in the background
     """
     try:
         # Validate file type
@@ -156,15 +213,16 @@ async def upload_face(file: UploadFile = File(...)):
         save_dir = Path("known_faces")
         save_dir.mkdir(exist_ok=True)
         
-        # Save file
+        # Save file (non-blocking, chunked)
         file_path = save_dir / file.filename
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        async with aiofiles.open(file_path, "wb") as buffer:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                await buffer.write(chunk)
             
-        # Reload database
-        vision_engine.reload_faces()
+        # Reload database after the response is sent (runs in the threadpool)
+        background_tasks.add_task(vision_engine.reload_faces)
         
-        return JSONResponse(content={
+        return JSONResponse(status_code=202, content={
             "status": "success",
             "message": f"Registered face: {file.filename}",
             "filename": file.filename
@@ -181,9 +239,7 @@ async def delete_face(name: str):
     """
     try:
         # Find the file associated with the name
-        target_path = None
-        if name in vision_engine.face_db.known_faces:
-            target_path = vision_engine.face_db.known_faces[name]
+        target_path = await asyncio.to_thread(vision_engine.get_face_path, name)
         
         if not target_path or not os.path.exists(target_path):
             raise HTTPException(status_code=404, detail="Face not found")
@@ -191,8 +247,8 @@ async def delete_face(name: str):
         # Delete file
         os.remove(target_path)
         
-        # Reload database
-        vision_engine.reload_faces()
+        # Reload database (off the event loop)
+        await asyncio.to_thread(vision_engine.reload_faces)
         
         return JSONResponse(content={
             "status": "success",
@@ -222,9 +278,20 @@ if __name__ == "__main__":
     ╚═══════════════════════════════════════════════════════════╝
     """)
     
-    uvicorn.run(
-        "main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True
-    )
+    # // [SCALE]: With several workers the camera + models move to a single
+    # // engine host process; workers only serve HTTP and proxy to it
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    engine_process = engine_host.start(**ENGINE_CONFIG) if workers > 1 else None
+    
+    try:
+        uvicorn.run(
+            "main:app",
+            host="0.0.0.0",
+            port=8000,
+            workers=workers,
+            reload=workers == 1
+        )
+    finally:
+        if engine_process is not None:
+            engine_process.terminate()
+            engine_process.join(timeout=5)
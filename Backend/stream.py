@@ -0,0 +1,37 @@
+# // [SYSTEM_CHECK]: GODS_EYE MJPEG STREAM
+# // [CLASSIFICATION]: VIDEO FEED FRAMING
+# // [STATUS]: ONLINE
+
+"""
+stream.py - Multipart JPEG framing for the /video_feed endpoint
+Kept free of the vision stack (torch, ultralytics, OpenCV) so HTTP workers
+that proxy to the engine host can import it without loading any models.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncGenerator, Optional
+
+
+async def mjpeg_stream(engine, executor: Optional[ThreadPoolExecutor] = None) -> AsyncGenerator[bytes, None]:
+    """
+    Async generator yielding multipart JPEG chunks from a VisionEngine.
+    Works with a local engine or a proxy to one hosted in another process
+    (see engine_host.py); blocking calls run in an executor so the event
+    loop only awaits results.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            encoded = await loop.run_in_executor(executor, engine.read_jpeg_batch)
+            
+            for frame_bytes in encoded:
+                yield (b'--frame\r\n'
+                       b'Content-Type: image/jpeg\r\n\r\n' + frame_bytes + b'\r\n')
+            
+            # // [YIELD]: Cooperate with other requests on the event loop
+            await asyncio.sleep(0)
+                   
+    except Exception as e:
+        print(f"[CRITICAL] Vision Engine error: {e}")
+        raise
@@ -8,15 +8,37 @@ Handles webcam capture, YOLOv8 inference, facial recognition via DeepFace.
 """
 
 import cv2
-import csv
+import itertools
+import json
+import numpy as np
 import os
+import queue
+import sqlite3
 import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Generator, List, Tuple, Optional, Dict
+from typing import AsyncGenerator, Deque, Iterator, List, Tuple, Optional, Dict, Union
+import torch
 from ultralytics import YOLO
+try:
+    from ultralytics.utils.nms import non_max_suppression
+except ImportError:  # ultralytics < 8.4
+    from ultralytics.utils.ops import non_max_suppression
+
+from stream import mjpeg_stream
+
+# // [IMPORT]: InsightFace - single-pass face detection + ArcFace embedding
+try:
+    from insightface.app import FaceAnalysis
+    from insightface.utils import face_align
+    INSIGHTFACE_AVAILABLE = True
+except ImportError:
+    INSIGHTFACE_AVAILABLE = False
 
-# // [IMPORT]: DeepFace for facial recognition
+# // [IMPORT]: DeepFace as the fallback recognition backend
 try:
     from deepface import DeepFace
     DEEPFACE_AVAILABLE = True
@@ -24,15 +46,344 @@ try:
     os.environ['TF_CPP_MIN_LOG_LEVEL'] = '2'
 except ImportError:
     DEEPFACE_AVAILABLE = False
-    print("[WARNING] DeepFace not installed. Identity recognition disabled.")
+
+FACE_RECOGNITION_AVAILABLE = INSIGHTFACE_AVAILABLE or DEEPFACE_AVAILABLE
+if not FACE_RECOGNITION_AVAILABLE:
+    print("[WARNING] Neither InsightFace nor DeepFace installed. Identity recognition disabled.")
+
+# // [IMPORT]: ONNX Runtime provider discovery (TensorRT / CUDA when a GPU is present)
+try:
+    import onnxruntime as ort
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
+ONNX_PROVIDER_CHAIN = ("TensorrtExecutionProvider", "CUDAExecutionProvider", "CPUExecutionProvider")
+GPU_AVAILABLE = torch.cuda.is_available()
+
+# // [IMPORT]: FAISS for nearest-identity search
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+# // [IMPORT]: libjpeg-turbo SIMD encoder for the MJPEG stream
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR, TJSAMP_420
+    TURBOJPEG_AVAILABLE = True
+except ImportError:
+    TURBOJPEG_AVAILABLE = False
+    print("[WARNING] PyTurboJPEG not installed. Falling back to cv2.imencode.")
+
+# // [IMPORT]: OpenVINO Runtime for compiled IR inference
+try:
+    import openvino as ov
+    from openvino.preprocess import ColorFormat, PrePostProcessor
+    OPENVINO_AVAILABLE = True
+except ImportError:
+    OPENVINO_AVAILABLE = False
+
+# // [IMPORT]: Numba JIT for detection post-processing
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _filter_persons_kernel(xyxy, cls, conf, person_id):
+    """
+    // [KERNEL]: Fused class mask + gather into packed int32 boxes / float32 scores
+    """
+    n = 0
+    for i in range(cls.shape[0]):
+        if cls[i] == person_id:
+            n += 1
+    
+    out_xyxy = np.empty((n, 4), dtype=np.int32)
+    out_conf = np.empty(n, dtype=np.float32)
+    j = 0
+    for i in range(cls.shape[0]):
+        if cls[i] == person_id:
+            for k in range(4):
+                out_xyxy[j, k] = np.int32(xyxy[i, k])
+            out_conf[j] = conf[i]
+            j += 1
+    return out_xyxy, out_conf
+
+
+def _filter_persons_numpy(xyxy, cls, conf, person_id):
+    """Vectorized NumPy equivalent of the kernel (used without Numba)"""
+    mask = cls == person_id
+    return xyxy[mask].astype(np.int32), conf[mask].astype(np.float32)
+
+
+# // [AOT]: Compile for the exact signature at import - no first-frame JIT stall
+if NUMBA_AVAILABLE:
+    filter_persons = njit(
+        "Tuple((int32[:, ::1], float32[::1]))(float32[:, :], float32[:], float32[:], int64)",
+        cache=True
+    )(_filter_persons_kernel)
+else:
+    filter_persons = _filter_persons_numpy
+
+
+def box_iou(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Pairwise IoU between (N, 4) and (M, 4) xyxy boxes -> (N, M)"""
+    a = a.astype(np.float32, copy=False)[:, None, :]
+    b = b.astype(np.float32, copy=False)[None, :, :]
+    inter_w = np.clip(np.minimum(a[..., 2], b[..., 2]) - np.maximum(a[..., 0], b[..., 0]), 0, None)
+    inter_h = np.clip(np.minimum(a[..., 3], b[..., 3]) - np.maximum(a[..., 1], b[..., 1]), 0, None)
+    inter = inter_w * inter_h
+    area_a = (a[..., 2] - a[..., 0]) * (a[..., 3] - a[..., 1])
+    area_b = (b[..., 2] - b[..., 0]) * (b[..., 3] - b[..., 1])
+    return inter / np.maximum(area_a + area_b - inter, 1e-6)
+
+
+class PersonTracker:
+    """
+    // [MODULE]: PersonTracker
+    // [PURPOSE]: Persistent track IDs for person boxes via greedy IoU matching
+    // between consecutive detector runs
+    """
+    
+    MATCH_IOU = 0.3  # Minimum overlap to continue a track
+    MAX_MISSED = 5  # Detector runs a track survives without a match
+    
+    def __init__(self):
+        # // [STATE]: track_id -> {"bbox", "missed", "identity", "confirmed", "confirmed_at_frame"}
+        # // (identity None until recognized)
+        self.tracks: Dict[int, Dict] = {}
+        self._next_id = itertools.count(1)
+    
+    def update(self, xyxy: np.ndarray) -> List[int]:
+        """Match boxes to live tracks (best IoU first), open new tracks, age out lost ones"""
+        track_ids = list(self.tracks)
+        assigned: List[Optional[int]] = [None] * len(xyxy)
+        matched = set()
+        
+        if track_ids and len(xyxy):
+            iou = box_iou(xyxy, np.array([self.tracks[t]["bbox"] for t in track_ids]))
+            for flat in np.argsort(iou, axis=None)[::-1]:
+                i, j = divmod(int(flat), len(track_ids))
+                if iou[i, j] < self.MATCH_IOU:
+                    break
+                if assigned[i] is None and track_ids[j] not in matched:
+                    assigned[i] = track_ids[j]
+                    matched.add(track_ids[j])
+        
+        for i, track_id in enumerate(assigned):
+            if track_id is None:
+                track_id = assigned[i] = next(self._next_id)
+                self.tracks[track_id] = {"identity": None, "confirmed": False, "confirmed_at_frame": 0}
+            self.tracks[track_id]["bbox"] = xyxy[i]
+            self.tracks[track_id]["missed"] = 0
+        
+        for track_id in track_ids:
+            if track_id not in matched:
+                self.tracks[track_id]["missed"] += 1
+                if self.tracks[track_id]["missed"] > self.MAX_MISSED:
+                    del self.tracks[track_id]
+        
+        return assigned
+
+
+def l2_normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """Scale each row to unit length (all-zero rows stay zero and never match)"""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+
+def onnx_providers() -> List[str]:
+    """ONNX Runtime execution providers, fastest available first (TensorRT -> CUDA -> CPU)"""
+    if not ONNXRUNTIME_AVAILABLE:
+        return ["CPUExecutionProvider"]
+    available = set(ort.get_available_providers())
+    return [p for p in ONNX_PROVIDER_CHAIN if p in available] or ["CPUExecutionProvider"]
+
+
+class InsightFaceEmbedder:
+    """
+    // [MODULE]: InsightFaceEmbedder
+    // [PURPOSE]: buffalo_s pack - detector + landmarks + ArcFace in one ONNX Runtime pass
+    """
+    
+    name = "insightface"
+    MODEL_PACK = "buffalo_s"
+    DET_SIZE = (320, 320)
+    
+    def __init__(self):
+        providers = onnx_providers()
+        # // [MODULES]: Detection + ArcFace only - the pack's gender/age and landmark
+        # // heads would otherwise run on every face
+        self._app = FaceAnalysis(
+            name=self.MODEL_PACK, providers=providers, allowed_modules=["detection", "recognition"]
+        )
+        self._app.prepare(ctx_id=-1 if providers == ["CPUExecutionProvider"] else 0, det_size=self.DET_SIZE)
+        self._recognizer = self._app.models["recognition"]
+        print(f"[FACE_DB] InsightFace {self.MODEL_PACK} on {providers[0]}")
+    
+    def embed(self, image) -> Optional[np.ndarray]:
+        """Embedding of the largest face in an image path or BGR array"""
+        if isinstance(image, str):
+            image = cv2.imread(image)
+            if image is None:
+                return None
+        boxes, landmarks = self.detect(image)
+        if len(boxes) == 0:
+            return None
+        largest = int(np.argmax((boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])))
+        keep = slice(largest, largest + 1)
+        return self.embed_faces(image, boxes[keep], None if landmarks is None else landmarks[keep])[0]
+    
+    def detect(self, frame) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Every face in a frame as (N, 4) xyxy boxes + (N, 5, 2) landmarks"""
+        bboxes, kpss = self._app.det_model.detect(frame, max_num=0, metric="default")
+        return bboxes[:, :4].astype(np.float32), kpss
+    
+    def embed_faces(self, frame, boxes: np.ndarray, landmarks: Optional[np.ndarray]) -> np.ndarray:
+        """
+        // [BATCH]: Align every face and run ArcFace once over the stacked chips
+        
+        Returns:
+            (N, D) L2-normalized embeddings, one row per box
+        """
+        chip_size = self._recognizer.input_size[0]
+        if landmarks is not None:
+            chips = [face_align.norm_crop(frame, landmark=kps, image_size=chip_size) for kps in landmarks]
+        else:
+            h, w = frame.shape[:2]
+            chips = [
+                cv2.resize(frame[max(0, y1):min(h, y2), max(0, x1):min(w, x2)], (chip_size, chip_size))
+                for x1, y1, x2, y2 in boxes.astype(np.int32).tolist()
+            ]
+        return l2_normalize_rows(self._recognizer.get_feat(chips))
+
+
+class DeepFaceEmbedder:
+    """
+    // [MODULE]: DeepFaceEmbedder
+    // [PURPOSE]: Fallback backend - YuNet (else OpenCV) detector + VGG-Face
+    """
+    
+    name = "deepface-opencv"  # Also keys the gallery cache - one per detector
+    MODEL_NAME = "VGG-Face"
+    DETECTOR_BACKEND = "opencv"
+    
+    # // [CONFIG]: YuNet single-pass face detector (OpenCV Zoo ONNX, optional file)
+    YUNET_MODEL = "face_detection_yunet_2023mar.onnx"
+    YUNET_SCORE_THRESHOLD = 0.6
+    CHIP_SIZE = 224  # VGG-Face input
+    
+    # // [ALIGN]: ArcFace 112x112 reference positions of the eyes, nose tip and mouth corners
+    ALIGN_TEMPLATE = np.array(
+        [[38.2946, 51.6963], [73.5318, 51.5014], [56.0252, 71.7366], [41.5493, 92.3655], [70.7299, 92.2041]],
+        dtype=np.float32
+    )
+    
+    def __init__(self):
+        self._yunet = None
+        self._yunet_lock = threading.Lock()  # setInputSize + detect must not interleave
+        if Path(self.YUNET_MODEL).exists():
+            try:
+                self._yunet = cv2.FaceDetectorYN.create(self.YUNET_MODEL, "", (320, 320), self.YUNET_SCORE_THRESHOLD)
+                # // [CACHE]: Aligned chips embed differently - keep a separate gallery cache
+                self.name = "deepface-yunet"
+            except (AttributeError, cv2.error) as e:
+                print(f"[FACE_DB] YuNet unavailable: {e}")
+        print(f"[FACE_DB] DeepFace {self.MODEL_NAME} with {'YuNet' if self._yunet is not None else 'OpenCV'} face detector")
+    
+    def embed(self, image) -> Optional[np.ndarray]:
+        """
+        Embedding of the largest face in an image path or BGR array - through the
+        same detect() -> embed_faces() path as live probes, so both sides compare
+        """
+        if isinstance(image, str):
+            image = cv2.imread(image)
+            if image is None:
+                return None
+        boxes, landmarks = self.detect(image)
+        if len(boxes) == 0:
+            return None
+        largest = int(np.argmax((boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])))
+        keep = slice(largest, largest + 1)
+        embedding = self.embed_faces(image, boxes[keep], None if landmarks is None else landmarks[keep])[0]
+        return embedding if embedding.any() else None
+    
+    def detect(self, frame) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Every face in a frame as (N, 4) xyxy boxes + (N, 5, 2) landmarks (None without YuNet)"""
+        if self._yunet is not None:
+            h, w = frame.shape[:2]
+            with self._yunet_lock:
+                self._yunet.setInputSize((w, h))
+                _, faces = self._yunet.detect(frame)
+            if faces is None:
+                return np.empty((0, 4), dtype=np.float32), np.empty((0, 5, 2), dtype=np.float32)
+            # // [LAYOUT]: Rows are [x, y, w, h, 5 x (lx, ly), score]
+            boxes = faces[:, :4].copy()
+            boxes[:, 2:] += boxes[:, :2]
+            return boxes.astype(np.float32), faces[:, 4:14].reshape(-1, 5, 2).astype(np.float32)
+        
+        try:
+            faces = DeepFace.extract_faces(
+                img_path=frame,
+                detector_backend=self.DETECTOR_BACKEND,
+                enforce_detection=True,
+                align=False
+            )
+        except ValueError:
+            faces = []  # No face in frame
+        boxes = [
+            [area["x"], area["y"], area["x"] + area["w"], area["y"] + area["h"]]
+            for area in (face["facial_area"] for face in faces)
+        ]
+        return np.array(boxes, dtype=np.float32).reshape(-1, 4), None
+    
+    def _align(self, frame, landmarks: np.ndarray) -> np.ndarray:
+        """Warp a face onto the ArcFace template at CHIP_SIZE from its five landmarks"""
+        template = self.ALIGN_TEMPLATE * (self.CHIP_SIZE / 112.0)
+        matrix, _ = cv2.estimateAffinePartial2D(landmarks, template, method=cv2.LMEDS)
+        return cv2.warpAffine(frame, matrix, (self.CHIP_SIZE, self.CHIP_SIZE), borderValue=0)
+    
+    def embed_faces(self, frame, boxes: np.ndarray, landmarks: Optional[np.ndarray]) -> np.ndarray:
+        """
+        (N, D) L2-normalized embeddings, one row per box.
+        DeepFace has no batched forward, so each chip is embedded with detection skipped -
+        aligned from its landmarks when YuNet supplied them, else the raw box crop.
+        """
+        if landmarks is not None:
+            chips = [self._align(frame, kps) for kps in landmarks]
+        else:
+            h, w = frame.shape[:2]
+            chips = [
+                frame[max(0, y1):min(h, y2), max(0, x1):min(w, x2)]
+                for x1, y1, x2, y2 in boxes.astype(np.int32).tolist()
+            ]
+        embeddings = [
+            DeepFace.represent(
+                img_path=chip,
+                model_name=self.MODEL_NAME,
+                enforce_detection=False,
+                detector_backend="skip"
+            )[0]["embedding"]
+            for chip in chips
+        ]
+        return l2_normalize_rows(embeddings)
 
 
 class FaceDatabase:
     """
     // [MODULE]: FaceDatabase
-    // [PURPOSE]: Manage known faces folder for DeepFace verification
+    // [PURPOSE]: Known-face gallery with precomputed face embeddings
     """
     
+    # // [CONFIG]: Matching
+    MATCH_THRESHOLD = 0.4  # Minimum cosine similarity to accept an identity...
+    MAX_L2_DISTANCE = 1.0  # ...and maximum L2 distance between unit embeddings
+    CACHE_FILE = ".embeddings_{backend}.npz"  # Per-image embeddings keyed by path + mtime
+    
     def __init__(self, known_faces_dir: str = "known_faces"):
         """
         // [INIT]: Initialize face database
@@ -41,100 +392,230 @@ class FaceDatabase:
             known_faces_dir: Path to folder containing face images
         """
         self.known_faces_dir = Path(known_faces_dir)
-        self.known_faces: Dict[str, str] = {}  # name -> image_path
+        self.known_faces: Dict[str, str] = {}  # name -> image_path (embedded identities)
+        self.face_files: Dict[str, str] = {}  # name -> image_path (every image, even unembeddable)
+        
+        # // [BACKEND]: Prefer InsightFace; embeddings are not comparable across backends
+        self.embedder: Optional[Union[InsightFaceEmbedder, DeepFaceEmbedder]] = None
+        if INSIGHTFACE_AVAILABLE:
+            try:
+                self.embedder = InsightFaceEmbedder()
+            except Exception as e:
+                print(f"[FACE_DB] InsightFace unavailable: {e}")
+        if self.embedder is None and DEEPFACE_AVAILABLE:
+            self.embedder = DeepFaceEmbedder()
+        self.backend: Optional[str] = self.embedder.name if self.embedder is not None else None
+        print(f"[FACE_DB] Recognition backend: {self.backend or 'none'}")
         
-        self._load_known_faces()
+        # // [GALLERY]: (names, embeddings, index) - row i (L2-normalized) belongs to
+        # // names[i]; index is a FAISS inner-product index over the same rows (or None).
+        # // Swapped as one tuple so readers never see a half-reloaded gallery
+        self.gallery: Tuple[List[str], np.ndarray, Optional["faiss.Index"]] = (
+            [], np.empty((0, 0), dtype=np.float32), None
+        )
+        
+        # // [LOCK]: Reloads run from API worker threads; one at a time, so two scans
+        # // never write the embedding cache together or publish out of order
+        self._reload_lock = threading.Lock()
+        
+        self.reload_faces()
     
     def reload_faces(self) -> None:
         """
         // [RELOAD]: Re-scan known_faces directory
         """
-        self.known_faces.clear()
-        self._load_known_faces()
+        with self._reload_lock:
+            self._load_known_faces()
     
-    def _load_known_faces(self) -> None:
+    def detect_faces(self, frame) -> Tuple[np.ndarray, Optional[np.ndarray]]:
         """
-        // [SYSTEM_LOG]: Scan known_faces folder and catalog images
+        // [DETECT]: Locate every face in a full frame in one call
+        
+        Returns:
+            Tuple of ((N, 4) xyxy boxes, (N, 5, 2) landmarks or None)
         """
-        if not DEEPFACE_AVAILABLE:
-            print("[FACE_DB] DeepFace library not available")
+        if self.embedder is None:
+            return np.empty((0, 4), dtype=np.float32), None
+        return self.embedder.detect(frame)
+    
+    def embed_faces(self, frame, boxes: np.ndarray, landmarks: Optional[np.ndarray]) -> np.ndarray:
+        """
+        // [EMBED]: One batched embedding call for a set of detected faces
+        
+        Returns:
+            (N, D) L2-normalized embeddings
+        """
+        return self.embedder.embed_faces(frame, boxes, landmarks)
+    
+    def _load_embedding_cache(self) -> Dict[str, Tuple[float, Optional[np.ndarray]]]:
+        """Read path -> (mtime, embedding or None for a failed image) from the on-disk cache"""
+        cache_path = self.known_faces_dir / self.CACHE_FILE.format(backend=self.backend)
+        if not cache_path.exists():
+            return {}
+        try:
+            with np.load(cache_path, allow_pickle=False) as data:
+                cache = {
+                    str(path): (float(mtime), embedding)
+                    for path, mtime, embedding in zip(data["paths"], data["mtimes"], data["embeddings"])
+                }
+                if "failed_paths" in data.files:
+                    cache.update(
+                        (str(path), (float(mtime), None))
+                        for path, mtime in zip(data["failed_paths"], data["failed_mtimes"])
+                    )
+                return cache
+        except Exception as e:
+            print(f"[FACE_DB] Ignoring unreadable embedding cache: {e}")
+            return {}
+    
+    def _save_embedding_cache(self, entries: Dict[str, Tuple[float, Optional[np.ndarray]]]) -> None:
+        """Persist path -> (mtime, embedding) so restarts skip the forward passes (failures included)"""
+        if not entries:
             return
-            
+        paths = [p for p in entries if entries[p][1] is not None]
+        failed = [p for p in entries if entries[p][1] is None]
+        np.savez(
+            self.known_faces_dir / self.CACHE_FILE.format(backend=self.backend),
+            paths=np.array(paths, dtype=str),
+            mtimes=np.array([entries[p][0] for p in paths], dtype=np.float64),
+            embeddings=np.stack([entries[p][1] for p in paths]) if paths else np.empty((0, 0), dtype=np.float32),
+            failed_paths=np.array(failed, dtype=str),
+            failed_mtimes=np.array([entries[p][0] for p in failed], dtype=np.float64)
+        )
+    
+    def _load_known_faces(self) -> None:
+        """
+        // [SYSTEM_LOG]: Scan known_faces folder and embed each image once
+        """
         if not self.known_faces_dir.exists():
             print(f"[FACE_DB] Creating known_faces directory: {self.known_faces_dir}")
             self.known_faces_dir.mkdir(parents=True, exist_ok=True)
             return
         
-        # // [SCAN]: Process each image file in the directory
+        # // [SCAN]: Every image stays addressable by name (so it can be deleted),
+        # // whether or not it yields an embedding
         valid_extensions = {'.jpg', '.jpeg', '.png', '.bmp'}
+        face_files = {
+            image_path.stem.replace("_", " ").title(): str(image_path.absolute())
+            for image_path in sorted(self.known_faces_dir.iterdir())
+            if image_path.suffix.lower() in valid_extensions
+        }
+        
+        if self.backend is None:
+            self.face_files = face_files
+            print("[FACE_DB] No face recognition library available")
+            return
+        
+        cache = self._load_embedding_cache()
+        entries: Dict[str, Tuple[float, Optional[np.ndarray]]] = {}
+        known_faces: Dict[str, str] = {}
+        names: List[str] = []
+        vectors: List[np.ndarray] = []
         
-        for image_path in self.known_faces_dir.iterdir():
-            if image_path.suffix.lower() not in valid_extensions:
+        for name, path in face_files.items():
+            mtime = Path(path).stat().st_mtime
+            
+            # // [CACHE]: Failures are cached too - a bad image is retried only once it changes
+            cached = cache.get(path)
+            if cached is not None and cached[0] == mtime:
+                embedding = cached[1]
+            else:
+                try:
+                    embedding = self.embedder.embed(path)
+                except Exception as e:
+                    print(f"[FACE_DB] ✗ Failed to embed {name}: {e}")
+                    embedding = None
+                else:
+                    if embedding is None:
+                        print(f"[FACE_DB] ✗ No face embedding for {name}")
+            
+            entries[path] = (mtime, embedding)
+            if embedding is None:
                 continue
-                
-            # // [STORE]: Use filename (without extension) as identity name
-            name = image_path.stem.replace("_", " ").title()
-            self.known_faces[name] = str(image_path.absolute())
+            known_faces[name] = path
+            names.append(name)
+            vectors.append(embedding)
             print(f"[FACE_DB] ✓ Registered: {name}")
         
+        if entries.keys() != cache.keys() or any(entries[p][0] != cache[p][0] for p in entries):
+            self._save_embedding_cache(entries)
+        
+        # // [SWAP]: Publish the new gallery in one step (identify_face may be running)
+        embeddings = np.stack(vectors) if vectors else np.empty((0, 0), dtype=np.float32)
+        self.gallery = (names, embeddings, self._build_index(embeddings))
+        self.known_faces = known_faces
+        self.face_files = face_files
+        
         print(f"[FACE_DB] Loaded {len(self.known_faces)} known identities")
     
+    @staticmethod
+    def _build_index(embeddings: np.ndarray) -> Optional["faiss.Index"]:
+        """Exact inner-product (= cosine on unit vectors) index over the gallery"""
+        if not FAISS_AVAILABLE or embeddings.shape[0] == 0:
+            return None
+        index = faiss.IndexFlatIP(embeddings.shape[1])
+        index.add(np.ascontiguousarray(embeddings, dtype=np.float32))
+        return index
+    
     def identify_face(self, face_image) -> Tuple[str, float, bool]:
         """
-        // [IDENTIFY]: Compare face image against known faces using DeepFace
+        // [IDENTIFY]: Embed a single face image and match it against the gallery
         
         Returns:
             Tuple of (name, confidence, is_known)
         """
-        if not self.known_faces or not DEEPFACE_AVAILABLE:
+        if not self.gallery[0] or self.backend is None:
             return ("UNKNOWN", 0.0, False)
         
         try:
-            # // [SAVE]: numpy array to temp file for DeepFace
-            import tempfile
-            temp_path = None
-            
-            if isinstance(face_image, str):
-                temp_path = face_image
+            probe = self.embedder.embed(face_image)
+        except Exception as e:
+            print(f"[FACE_DB] Verification error: {e}")
+            return ("ERROR", 0.0, False)
+        return self.match(probe) if probe is not None else ("UNKNOWN", 0.0, False)
+    
+    def match(self, probe: np.ndarray) -> Tuple[str, float, bool]:
+        """
+        // [MATCH]: Nearest known identity for one L2-normalized embedding
+        
+        Returns:
+            Tuple of (name, confidence, is_known)
+        """
+        return self.match_many(probe[None, :])[0]
+    
+    def match_many(self, probes: np.ndarray) -> List[Tuple[str, float, bool]]:
+        """
+        // [MATCH]: Nearest known identity for each row of an (N, D) embedding batch
+        
+        Returns:
+            List of (name, confidence, is_known), one per probe
+        """
+        names, embeddings, index = self.gallery
+        results = [("UNKNOWN", 0.0, False)] * len(probes)
+        if not names or len(probes) == 0 or probes.shape[1] != embeddings.shape[1]:
+            return results
+        
+        try:
+            # // [SEARCH]: Top-1 by inner product for the whole batch (FAISS, else one BLAS mat-mul)
+            if index is not None:
+                scores, ids = index.search(np.ascontiguousarray(probes, dtype=np.float32), 1)
+                best, confidences = ids[:, 0], scores[:, 0]
             else:
-                # face_image is numpy array - save to temp file
-                temp_file = tempfile.NamedTemporaryFile(suffix='.jpg', delete=False)
-                temp_path = temp_file.name
-                temp_file.close()
-                cv2.imwrite(temp_path, face_image)
+                similarities = probes @ embeddings.T
+                best = np.argmax(similarities, axis=1)
+                confidences = similarities[np.arange(len(probes)), best]
             
-            # // [COMPARE]: Check against each known face
-            for name, known_path in self.known_faces.items():
-                try:
-                    result = DeepFace.verify(
-                        img1_path=temp_path,
-                        img2_path=known_path,
-                        model_name="VGG-Face",
-                        enforce_detection=False,
-                        detector_backend="retinaface"
-                    )
-                    
-                    if result["verified"]:
-                        confidence = 1.0 - result["distance"]
-                        print(f"[FACE_DB] ✓ MATCH: {name} (conf: {confidence:.2f})")
-                        # Cleanup temp file
-                        if temp_path != face_image:
-                            os.remove(temp_path)
-                        return (name, confidence, True)
-                        
-                except Exception as e:
-                    # print(f"[FACE_DB] Compare error for {name}: {e}")
-                    continue
-            
-            # Cleanup temp file
-            if temp_path != face_image:
-                os.remove(temp_path)
-            
-            return ("UNKNOWN", 0.0, False)
+            # // [ACCEPT]: Double threshold - similarity high AND unit-vector L2 distance low
+            l2_distances = np.sqrt(np.maximum(0.0, 2.0 - 2.0 * confidences))
+            for i, (row, confidence, l2_distance) in enumerate(zip(best.tolist(), confidences.tolist(), l2_distances.tolist())):
+                if confidence > self.MATCH_THRESHOLD and l2_distance < self.MAX_L2_DISTANCE:
+                    print(f"[FACE_DB] ✓ MATCH: {names[row]} (conf: {confidence:.2f})")
+                    results[i] = (names[row], confidence, True)
+            return results
             
         except Exception as e:
             print(f"[FACE_DB] Verification error: {e}")
-            return ("ERROR", 0.0, False)
+            return [("ERROR", 0.0, False)] * len(probes)
 
 
 class VisionEngine:
@@ -149,27 +630,109 @@ class VisionEngine:
     HUD_COLOR_ORANGE = (0, 99, 255)      # BGR - BO6 Orange (#FF6300)
     HUD_COLOR_CYAN = (255, 255, 0)       # BGR - Cyan accent
     BOX_THICKNESS = 2
+    CORNER_LENGTH = 15
+    LABEL_CACHE_SIZE = 512  # Pre-rendered label sprites kept before the cache resets
+    
+    # // [GEOMETRY]: bbox (x1, y1, x2, y2) column picks for outline vertices
+    # // and the four corner anchors
+    _OUTLINE_INDEX = np.array([[0, 1], [2, 1], [2, 3], [0, 3]])
+    _CORNER_INDEX = np.array([[0, 1], [2, 1], [0, 3], [2, 3]])
+    # // [GEOMETRY]: (4, 3, 2) unit offsets - each corner accent is one L-shaped
+    # // polyline running arm -> corner -> arm
+    _CORNER_TEMPLATE = np.array([
+        [[0, 1], [0, 0], [1, 0]],
+        [[-1, 0], [0, 0], [0, 1]],
+        [[0, -1], [0, 0], [1, 0]],
+        [[-1, 0], [0, 0], [0, -1]],
+    ], dtype=np.int32)
+    
     FONT = cv2.FONT_HERSHEY_SIMPLEX
     FONT_SCALE = 0.5
     FONT_THICKNESS = 1
     
+    # // [CONFIG]: Capture geometry - also the detector input size, so frames
+    # // go in without letterboxing (both sides must be multiples of the model stride)
+    FRAME_WIDTH = 640
+    FRAME_HEIGHT = 480
+    
     # // [CONFIG]: Performance tuning
     SKIP_FRAMES = 10  # Run YOLO inference every Nth frame (increased for performance)
-    FACE_SKIP_FRAMES = 15  # Run face recognition every Nth detection frame (DeepFace is heavy)
+    QUANTIZED_SKIP_FRAMES = 3  # Inference cadence when an INT8/FP16 exported model is loaded
+    FACE_SKIP_FRAMES = 15  # Face recognition cadence in detector cadences (every FACE_SKIP_FRAMES * skip_frames stream frames)
+    CONFIRM_CONFIDENCE = 0.6  # Match confidence that confirms a track's identity...
+    CONFIRM_WINDOW_FRAMES = 300  # ...which is then not re-embedded for this many frames
+    MOTION_THRESHOLD = 3.0  # Mean grey-level change that wakes the detector...
+    MOTION_REFRESH_FRAMES = 90  # ...which otherwise still runs this often on a static scene
+    MOTION_THUMB_SIZE = (80, 60)  # Downscaled frame the motion check runs on
+    RENDER_REUSE_THRESHOLD = 6  # Largest per-pixel grey change (thumbnail) that still re-sends the last JPEG
     PERSON_CLASS_ID = 0  # YOLO class ID for 'person'
+    BUFFER_SIZE = 1  # Capture ring depth - each stream step renders only the newest frame
+    CONF_THRESHOLD = 0.25  # Detector score / NMS settings (ultralytics predict defaults)
+    IOU_THRESHOLD = 0.7
+    JPEG_QUALITY = 80  # MJPEG stream quality
+    LOG_FLUSH_ROWS = 100  # Commit the detection log after this many queued rows...
+    LOG_FLUSH_INTERVAL = 0.1  # ...or this many seconds after the first one
+    LOG_MEMORY_ROWS = 1000  # Newest log rows kept in memory to serve /logs without a query
+    
+    # // [CONFIG]: Detector weights, fastest first (see export_model.py)
+    MODEL_CANDIDATES = (
+        "yolov8n_int8_openvino_model",    # OpenVINO INT8 (Intel CPU, VNNI)
+        "yolov8n_openvino_model",         # OpenVINO FP16 (Intel CPU)
+        "yolov8n.onnx",                   # ONNX Runtime
+    )
+    GPU_MODEL_CANDIDATES = (
+        "yolov8n.engine",                 # TensorRT INT8 (NVIDIA)
+        "yolov8n.onnx",                   # ONNX Runtime CUDA / TensorRT EP
+    )
+    DEFAULT_MODEL = "yolov8n.pt"          # FP32 PyTorch fallback
+    QUANTIZED_MODELS = frozenset({        # Reduced-precision exports that earn QUANTIZED_SKIP_FRAMES
+        "yolov8n_int8_openvino_model",
+        "yolov8n_openvino_model",
+        "yolov8n.engine",
+    })
+    
+    # // [CONFIG]: OpenVINO CPU plugin - single-request latency + compiled-blob cache
+    OPENVINO_CONFIG = {"PERFORMANCE_HINT": "LATENCY", "CACHE_DIR": ".ovcache"}
     
     def __init__(
         self, 
         camera_index: int = 0, 
-        log_file: str = "detection_history.csv",
-        known_faces_dir: str = "known_faces"
+        log_file: str = "detection_history.db",
+        known_faces_dir: str = "known_faces",
+        buffer_size: int = BUFFER_SIZE
     ):
         """
         // [INIT]: Initialize the Vision Engine with Face Recognition
+        
+        Args:
+            camera_index: OpenCV capture device index
+            log_file: Path to the SQLite detection log
+            known_faces_dir: Path to folder containing face images
+            buffer_size: Capacity of the capture ring buffer (only the newest frame is rendered)
         """
         # // [SYSTEM_LOG]: Loading neural network model...
-        print("[GODS_EYE] Loading YOLOv8n model...")
-        self.model = YOLO("yolov8n.pt")
+        model_path = self._resolve_model_path()
+        print(f"[GODS_EYE] Loading YOLOv8n model ({model_path})...")
+        self.device = 0 if GPU_AVAILABLE else "cpu"
+        self.model: Optional[YOLO] = None
+        self._ov_request: Optional["ov.InferRequest"] = None
+        self._net: Optional[torch.nn.Module] = None
+        self._net_dtype = torch.float16 if GPU_AVAILABLE else torch.float32
+        if model_path.endswith("_openvino_model") and OPENVINO_AVAILABLE:
+            self._ov_request = self._compile_openvino(model_path)
+        else:
+            self.model = YOLO(model_path, task="detect")
+            self._check_stride()
+            if isinstance(self.model.model, torch.nn.Module):
+                # // [FORWARD]: PyTorch weights are called directly (conv+bn fused, FP16 on GPU)
+                self._net = self.model.model.fuse(verbose=False).eval().to(self.device, self._net_dtype)
+                
+                # // [BGR]: Reverse the stem conv's input channels so the network reads
+                # // OpenCV's BGR frames directly (no cvtColor pass)
+                stem = self._net.model[0].conv
+                stem.weight.data = stem.weight.data.flip(1)
+        # // [CADENCE]: Only INT8 / FP16 artifacts run faster - yolov8n.onnx is FP32
+        self.skip_frames = self.QUANTIZED_SKIP_FRAMES if model_path in self.QUANTIZED_MODELS else self.SKIP_FRAMES
         
         # // [SYSTEM_LOG]: Initialize face database
         print("[GODS_EYE] Loading face database...")
@@ -182,95 +745,333 @@ class VisionEngine:
         # // [STATE]: Detection tracking
         self.last_detections: List[Dict] = []
         self.frame_count = 0
-        self.face_frame_count = 0
+        self._last_face_frame = 0  # Stream frame of the last scheduled face pass
+        self._frames_since_detection = 0
+        self._motion_reference: Optional[np.ndarray] = None
         self.person_detected = False
         self.identified_count = 0
-        self.detection_logs: List[dict] = []
         
-        # // [CACHE]: Store last identification results
-        self.identity_cache: Dict[str, Tuple[str, float, bool]] = {}
+        # // [CACHE]: Pre-rendered HUD text layers - the header is rebuilt once per
+        # second, status layers are kept per status line
+        self._hud_header_key: Optional[tuple] = None
+        self._hud_header_layer: Optional[Dict] = None
+        self._hud_status_layers: Dict[tuple, Dict] = {}
         
-        # // [PERSISTENCE]: CSV log file
-        self.log_file = Path(log_file)
-        self._init_csv_log()
+        # // [PREALLOC]: Corner accent offsets, added to the anchors of every box
+        self._corner_offsets = self._CORNER_TEMPLATE * self.CORNER_LENGTH
+        
+        # // [CACHE]: Pre-rendered label sprites keyed by (text, color)
+        self._label_sprites: Dict[Tuple[str, Tuple[int, int, int]], Tuple[np.ndarray, np.ndarray, int]] = {}
         
-        # // [THREADING]: Lock for thread-safe operations
+        # // [CACHE]: Last streamed JPEG, reused while the rendered view is unchanged
+        self._detection_key: tuple = ()
+        self._render_key: Optional[tuple] = None
+        self._render_reference: Optional[np.ndarray] = None
+        self._render_jpeg_bytes: Optional[bytes] = None
+        
+        # // [TRACKING]: Identities are remembered per track, not per screen position
+        self.tracker = PersonTracker()
+        
+        # // [THREADING]: Lock for thread-safe operations - never held across disk I/O
         self._lock = threading.Lock()
+        
+        # // [THREADING]: Serializes the shared SQLite connection (writer, log reads, shutdown)
+        self._db_lock = threading.Lock()
+        
+        # // [PERSISTENCE]: SQLite detection log (WAL)
+        self.log_file = Path(log_file)
+        self._init_log_db()
+        
+        # // [CACHE]: Bounded tail of raw log rows (oldest fall off in O(1)), seeded from disk
+        self._recent_logs: Deque[tuple] = deque(self._read_log_rows(self.LOG_MEMORY_ROWS), maxlen=self.LOG_MEMORY_ROWS)
+        
+        # // [PERSISTENCE]: Rows are queued by the detector and written off-thread
+        self._log_queue: "queue.Queue[Union[tuple, threading.Event, None]]" = queue.Queue()
+        self._log_thread = threading.Thread(target=self._log_writer_loop, name="gods_eye_log_writer", daemon=True)
+        self._log_thread.start()
+        
+        # // [THREADING]: Single worker pinned to annotation + encoding
+        self._inference_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gods_eye_inference")
+        
+        # // [ENCODER]: Reusable TurboJPEG handle (None -> cv2.imencode)
+        self._jpeg: Optional["TurboJPEG"] = None
+        if TURBOJPEG_AVAILABLE:
+            try:
+                self._jpeg = TurboJPEG()
+            except Exception as e:
+                print(f"[WARNING] libturbojpeg unavailable ({e}). Falling back to cv2.imencode.")
+        
+        # // [PREALLOC]: Inference input + JPEG output, reused every frame
+        self._input_tensor = torch.empty(
+            (1, 3, self.FRAME_HEIGHT, self.FRAME_WIDTH), dtype=torch.float32,
+            pin_memory=GPU_AVAILABLE  # Page-locked -> faster, async host-to-device copies
+        )
+        self._rgb_buf = np.empty((self.FRAME_HEIGHT, self.FRAME_WIDTH, 3), dtype=np.uint8)
+        self._jpeg_buf: Optional[np.ndarray] = None
+        
+        # // [CAPTURE]: Producer thread feeding a drop-oldest ring buffer
+        self._frame_buffer: Deque = deque(maxlen=buffer_size)
+        self._frame_lock = threading.Lock()
+        
+        # // [PREALLOC]: Frame slots decoded into in place - one set queued in the
+        # // ring buffer, one set in flight with the consumer
+        self._slot_count = 2 * buffer_size
+        self._free_slots: List[np.ndarray] = [
+            np.empty((self.FRAME_HEIGHT, self.FRAME_WIDTH, 3), dtype=np.uint8)
+            for _ in range(self._slot_count)
+        ]
+        self._frame_ready = threading.Event()
+        self._pipeline_lock = threading.Lock()
+        self._capture_running = True
+        self._capture_thread = threading.Thread(
+            target=self._capture_loop, name="gods_eye_capture", daemon=True
+        )
+        self._capture_thread.start()
+        
+        # // [DETECTOR]: Background worker fed with the freshest frame only, so the
+        # // stream keeps the camera's frame rate while YOLO + recognition run
+        self._detect_queue: "queue.Queue[Optional[np.ndarray]]" = queue.Queue(maxsize=1)
+        # // [PREALLOC]: Frame copies for the detector - one queued, one being processed
+        self._detect_buffers: List[np.ndarray] = [
+            np.empty((self.FRAME_HEIGHT, self.FRAME_WIDTH, 3), dtype=np.uint8) for _ in range(2)
+        ]
+        self._detector_thread = threading.Thread(
+            target=self._detector_loop, name="gods_eye_detector", daemon=True
+        )
+        self._detector_thread.start()
 
+    @classmethod
+    def _resolve_model_path(cls) -> str:
+        """Pick the first exported (quantized) model on disk, else the PyTorch weights"""
+        candidates = cls.GPU_MODEL_CANDIDATES if GPU_AVAILABLE else cls.MODEL_CANDIDATES
+        for candidate in candidates:
+            if Path(candidate).exists():
+                return candidate
+        return cls.DEFAULT_MODEL
+    
+    def _check_stride(self) -> None:
+        """Fail fast if the frame size is not a multiple of the PyTorch model's stride"""
+        if not isinstance(self.model.model, torch.nn.Module):
+            return  # Exported models were built for export_model.IMGSZ
+        stride = int(self.model.model.stride.max())
+        if self.FRAME_HEIGHT % stride or self.FRAME_WIDTH % stride:
+            raise ValueError(
+                f"[CRITICAL] Frame size {self.FRAME_WIDTH}x{self.FRAME_HEIGHT} is not a multiple of model stride {stride}"
+            )
+    
+    def _compile_openvino(self, model_dir: str) -> "ov.InferRequest":
+        """Compile an exported IR for the CPU with OPENVINO_CONFIG"""
+        core = ov.Core()
+        core.set_property("CPU", self.OPENVINO_CONFIG)
+        ov_model = core.read_model(next(Path(model_dir).glob("*.xml")))
+        
+        # // [SHAPE]: One camera frame per request - fully static shapes (older
+        # // dynamic-batch exports are pinned here too)
+        ov_model.reshape([1, 3, self.FRAME_HEIGHT, self.FRAME_WIDTH])
+        
+        # // [PREPROCESS]: Fold BGR->RGB, uint8->f32, /255 and NHWC->NCHW into the graph,
+        # // so raw OpenCV frames are fed without any host-side conversion
+        ppp = PrePostProcessor(ov_model)
+        ppp.input().tensor().set_element_type(ov.Type.u8).set_layout(ov.Layout("NHWC")).set_color_format(ColorFormat.BGR)
+        ppp.input().model().set_layout(ov.Layout("NCHW"))
+        ppp.input().preprocess().convert_element_type(ov.Type.f32).convert_color(ColorFormat.RGB).scale(255.0)
+        return core.compile_model(ppp.build(), "CPU").create_infer_request()
+    
     def reload_faces(self) -> None:
         """Reload the face database"""
         print("[GODS_EYE] Reloading face database...")
         self.face_db.reload_faces()
         
-    def _init_csv_log(self) -> None:
-        """Initialize CSV log file"""
-        if not self.log_file.exists():
-            with open(self.log_file, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(['timestamp', 'num_persons', 'identified', 'names'])
+    def _init_log_db(self) -> None:
+        """Open the SQLite detection log and create its table"""
+        self._db = sqlite3.connect(str(self.log_file), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS detections ("
+            "timestamp_ns INTEGER NOT NULL, "
+            "num_persons INTEGER NOT NULL, "
+            "identified INTEGER NOT NULL, "
+            "names TEXT NOT NULL)"
+        )
+        self._db.commit()
                 
+    def _read_log_rows(self, limit: int) -> List[tuple]:
+        """Newest `limit` rows from disk as (timestamp_ns, num_persons, identified, names)"""
+        with self._db_lock:
+            rows = self._db.execute(
+                "SELECT timestamp_ns, num_persons, identified, names FROM detections "
+                "ORDER BY rowid DESC LIMIT ?",
+                (limit,)
+            ).fetchall()
+        
+        # // [ORDER]: Oldest first, newest last
+        return [
+            (timestamp_ns, num_persons, identified, json.loads(names))
+            for timestamp_ns, num_persons, identified, names in reversed(rows)
+        ]
+    
     def _log_detection(self, num_persons: int, identified: int, names: List[str]) -> None:
-        """Write detection to CSV and memory log"""
-        timestamp = datetime.now().isoformat()
-        names_str = ", ".join(names) if names else "UNKNOWN"
+        """Queue a detection row for the log writer thread"""
+        # // [DEFERRED]: Store raw epoch nanoseconds, format only on API read
+        row = (time.time_ns(), num_persons, identified, names)
+        with self._lock:
+            self._recent_logs.append(row)
+        self._log_queue.put_nowait(row)
+    
+    def _log_writer_loop(self) -> None:
+        """
+        // [WORKER]: Collect queued rows for up to LOG_FLUSH_INTERVAL / LOG_FLUSH_ROWS,
+        // then write them with one executemany + commit. A None row stops the writer;
+        // an Event flushes everything queued before it, then is set.
+        """
+        while True:
+            row = self._log_queue.get()
+            stop = row is None
+            flushed = row if isinstance(row, threading.Event) else None
+            rows = [] if stop or flushed else [row]
+            deadline = time.monotonic() + self.LOG_FLUSH_INTERVAL
+            while not stop and not flushed and len(rows) < self.LOG_FLUSH_ROWS:
+                try:
+                    row = self._log_queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if row is None:
+                    stop = True
+                elif isinstance(row, threading.Event):
+                    flushed = row
+                else:
+                    rows.append(row)
+            
+            if rows:
+                # // [ERROR]: A failed write (disk full, locked file...) drops this batch
+                # // but keeps the writer alive, so the queue never grows unbounded
+                with self._db_lock:
+                    try:
+                        self._db.executemany(
+                            "INSERT INTO detections VALUES (?, ?, ?, ?)",
+                            [(ts, num_persons, identified, json.dumps(names)) for ts, num_persons, identified, names in rows]
+                        )
+                        self._db.commit()
+                    except sqlite3.Error as e:
+                        print(f"[LOG_DB] Error: dropped {len(rows)} rows: {e}")
+                        try:
+                            self._db.rollback()
+                        except sqlite3.Error:
+                            pass
+            if flushed is not None:
+                flushed.set()
+            if stop:
+                return
+    
+    def _draw_hud_boxes(self, frame, detections: List[Dict]) -> None:
+        """
+        Draw tactical HUD-style bounding boxes for every detection.
+        Frames and corner accents for all boxes of one color go out in a single
+        cv2.polylines call each.
+        """
+        if not detections:
+            return
         
-        with open(self.log_file, 'a', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow([timestamp, num_persons, identified, names_str])
+        boxes = np.array([d["bbox"] for d in detections], dtype=np.int32)  # (N, 4)
+        known = np.array([d["is_known"] for d in detections], dtype=bool)
         
-        with self._lock:
-            self.detection_logs.append({
-                "timestamp": timestamp,
-                "num_persons": num_persons,
-                "identified": identified,
-                "names": names
-            })
-            if len(self.detection_logs) > 1000:
-                self.detection_logs = self.detection_logs[-1000:]
+        # // [VECTORIZED]: (N, 4, 2) rectangle outlines and (N, 4, 3, 2) corner accents
+        outlines = boxes[:, self._OUTLINE_INDEX]
+        corners = boxes[:, self._CORNER_INDEX][:, :, None, :] + self._corner_offsets
+        
+        for is_known, color in ((True, self.HUD_COLOR_GREEN), (False, self.HUD_COLOR_RED)):
+            selected = known == is_known
+            if not selected.any():
+                continue
+            
+            # // [DRAW]: Main bounding rectangles
+            cv2.polylines(frame, list(outlines[selected]), True, color, self.BOX_THICKNESS)
+            
+            # // [DRAW]: Corner accents
+            cv2.polylines(frame, list(corners[selected].reshape(-1, 3, 2)), False, color, self.BOX_THICKNESS + 1)
+        
+        for detection in detections:
+            x1, y1 = detection["bbox"][:2]
+            self._draw_label(frame, x1, y1, detection["identity"], detection["face_conf"], detection["is_known"])
     
-    def _draw_hud_box(
-        self, 
-        frame, 
-        x1: int, y1: int, x2: int, y2: int,
-        identity: str, confidence: float, is_known: bool
-    ) -> None:
-        """Draw tactical HUD-style bounding box"""
+    def _draw_label(self, frame, x1: int, y1: int, identity: str, confidence: float, is_known: bool) -> None:
+        """Draw the identity label above a box"""
         color = self.HUD_COLOR_GREEN if is_known else self.HUD_COLOR_RED
         
-        # // [DRAW]: Main bounding rectangle
-        cv2.rectangle(frame, (x1, y1), (x2, y2), color, self.BOX_THICKNESS)
-        
-        # // [DRAW]: Corner accents
-        corner_length = 15
-        thickness = self.BOX_THICKNESS + 1
-        cv2.line(frame, (x1, y1), (x1 + corner_length, y1), color, thickness)
-        cv2.line(frame, (x1, y1), (x1, y1 + corner_length), color, thickness)
-        cv2.line(frame, (x2, y1), (x2 - corner_length, y1), color, thickness)
-        cv2.line(frame, (x2, y1), (x2, y1 + corner_length), color, thickness)
-        cv2.line(frame, (x1, y2), (x1 + corner_length, y2), color, thickness)
-        cv2.line(frame, (x1, y2), (x1, y2 - corner_length), color, thickness)
-        cv2.line(frame, (x2, y2), (x2 - corner_length, y2), color, thickness)
-        cv2.line(frame, (x2, y2), (x2, y2 - corner_length), color, thickness)
-        
         # // [LABEL]: Identity text
         if is_known:
             label = f"IDENTITY: {identity.upper()} [{int(confidence * 100)}%]"
         else:
             label = "UNKNOWN SUBJECT"
         
-        label_size = cv2.getTextSize(label, self.FONT, self.FONT_SCALE, self.FONT_THICKNESS)[0]
-        cv2.rectangle(frame, (x1, y1 - label_size[1] - 10), (x1 + label_size[0] + 4, y1 - 2), (0, 0, 0), -1)
-        cv2.putText(frame, label, (x1 + 2, y1 - 6), self.FONT, self.FONT_SCALE, color, self.FONT_THICKNESS)
+        # // [BLIT]: Copy the pre-rendered label instead of rasterizing text per frame
+        sprite, mask, top_offset = self._label_sprite(label, color)
+        self._blit(frame, sprite, mask, x1, y1 + top_offset)
+    
+    def _label_sprite(self, label: str, color: Tuple[int, int, int]) -> Tuple[np.ndarray, np.ndarray, int]:
+        """
+        Render (once) a label with its black backing plate.
+        
+        Returns:
+            Tuple of (BGR sprite, uint8 mask, sprite top relative to the box top)
+        """
+        key = (label, color)
+        cached = self._label_sprites.get(key)
+        if cached is not None:
+            return cached
+        
+        (text_w, text_h), baseline = cv2.getTextSize(label, self.FONT, self.FONT_SCALE, self.FONT_THICKNESS)
+        plate_h = text_h + 9                      # rows y1-text_h-10 .. y1-2
+        sprite_h = max(plate_h, text_h + 5 + baseline)  # keep descenders below the plate
+        sprite_w = text_w + 5                     # cols x1 .. x1+text_w+4
+        origin = (2, text_h + 4)                  # text at (x1+2, y1-6)
+        
+        sprite = np.zeros((sprite_h, sprite_w, 3), dtype=np.uint8)
+        cv2.putText(sprite, label, origin, self.FONT, self.FONT_SCALE, color, self.FONT_THICKNESS)
+        
+        text_mask = np.zeros((sprite_h, sprite_w), dtype=np.uint8)
+        cv2.putText(text_mask, label, origin, self.FONT, self.FONT_SCALE, 255, self.FONT_THICKNESS)
+        mask = text_mask > 0
+        mask[:plate_h] = True
+        
+        if len(self._label_sprites) >= self.LABEL_CACHE_SIZE:
+            self._label_sprites.clear()
+        cached = (sprite, mask.view(np.uint8), -(text_h + 10))
+        self._label_sprites[key] = cached
+        return cached
+    
+    @staticmethod
+    def _blit(frame, sprite: np.ndarray, mask: np.ndarray, x: int, y: int) -> None:
+        """Copy masked sprite pixels onto the frame at (x, y), clipped to its bounds"""
+        h, w = frame.shape[:2]
+        sh, sw = sprite.shape[:2]
+        fx1, fy1 = max(0, x), max(0, y)
+        fx2, fy2 = min(w, x + sw), min(h, y + sh)
+        if fx1 >= fx2 or fy1 >= fy2:
+            return
+        sx1, sy1 = fx1 - x, fy1 - y
+        sx2, sy2 = sx1 + fx2 - fx1, sy1 + fy2 - fy1
+        
+        # // [SIMD]: cv2.copyTo writes straight into the frame view - far cheaper than np.copyto(where=)
+        cv2.copyTo(sprite[sy1:sy2, sx1:sx2], mask[sy1:sy2, sx1:sx2], frame[fy1:fy2, fx1:fx2])
     
     def _draw_hud_overlay(self, frame) -> None:
         """Draw tactical HUD overlay"""
         height, width = frame.shape[:2]
         
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        cv2.putText(frame, f"[GODS_EYE v2.0] {timestamp}", (10, 25), self.FONT, 0.5, self.HUD_COLOR_ORANGE, 1)
-        
-        db_status = f"FACE_DB: {len(self.face_db.known_faces)} IDENTITIES"
-        cv2.putText(frame, db_status, (10, 45), self.FONT, 0.4, self.HUD_COLOR_CYAN, 1)
+        # // [CACHE]: Header (clock + FACE_DB) only changes when the second ticks over
+        second = int(time.time())
+        face_total = len(self.face_db.known_faces)
+        header_key = (second, face_total)
+        if header_key != self._hud_header_key:
+            self._hud_header_key = header_key
+            clock_text = f"[GODS_EYE v2.0] {datetime.fromtimestamp(second).strftime('%Y-%m-%d %H:%M:%S')}"
+            self._hud_header_layer = self._render_hud_layer([
+                (clock_text, (10, 25), 0.5, self.HUD_COLOR_ORANGE, 1),
+                (f"FACE_DB: {face_total} IDENTITIES", (10, 45), 0.4, self.HUD_COLOR_CYAN, 1),
+            ])
+        self._blend_hud_layer(frame, self._hud_header_layer)
         
         if self.identified_count > 0:
             status = f"IDENTIFIED: {self.identified_count}"
@@ -281,151 +1082,560 @@ class VisionEngine:
         else:
             status = "SEARCHING..."
             status_color = self.HUD_COLOR_CYAN
-            
-        cv2.putText(frame, f"STATUS: {status}", (10, height - 15), self.FONT, 0.6, status_color, 2)
+        
+        status_key = (status, status_color, height)
+        status_layer = self._hud_status_layers.get(status_key)
+        if status_layer is None:
+            if len(self._hud_status_layers) >= self.LABEL_CACHE_SIZE:
+                self._hud_status_layers.clear()
+            status_layer = self._render_hud_layer([(f"STATUS: {status}", (10, height - 15), 0.6, status_color, 2)])
+            self._hud_status_layers[status_key] = status_layer
+        self._blend_hud_layer(frame, status_layer)
+        
+        # // [DYNAMIC]: The frame counter changes every frame, so it is the only text rasterized here
         cv2.putText(frame, f"FRAME: {self.frame_count}", (width - 120, 25), self.FONT, 0.4, self.HUD_COLOR_ORANGE, 1)
     
-    def _identify_person(self, frame, x1: int, y1: int, x2: int, y2: int) -> Tuple[str, float, bool]:
-        """Extract face from person crop and identify via DeepFace"""
-        if not DEEPFACE_AVAILABLE:
-            return ("N/A", 0.0, False)
+    def _render_hud_layer(self, lines: List[Tuple[str, Tuple[int, int], float, Tuple[int, int, int], int]]) -> Dict:
+        """
+        Rasterize HUD text once into a layer that can be blended onto every frame.
         
-        try:
-            h, w = frame.shape[:2]
-            pad = 10
-            crop_x1 = max(0, x1 - pad)
-            crop_x2 = min(w, x2 + pad)
-            
-            # // [HEAD_REGION]: Extract upper 40% of person bbox (where face is)
-            person_height = y2 - y1
-            head_y1 = max(0, y1 - pad)
-            head_y2 = min(h, y1 + int(person_height * 0.4))  # Top 40% = head region
-            
-            head_crop = frame[head_y1:head_y2, crop_x1:crop_x2]
+        Args:
+            lines: (text, origin, scale, color, thickness) with origins in frame coordinates
             
-            if head_crop.size == 0 or head_crop.shape[0] < 20 or head_crop.shape[1] < 20:
-                return ("UNKNOWN", 0.0, False)
+        Returns:
+            Layer with a premultiplied BGR sprite, its inverse alpha and its frame position
+        """
+        extents = []
+        for text, (x, y), scale, _, thickness in lines:
+            (text_w, text_h), baseline = cv2.getTextSize(text, self.FONT, scale, thickness)
+            pad = thickness + 1  # stroke width + anti-aliasing spill past the metrics
+            extents.append((x - pad, y - text_h - pad, x + text_w + pad, y + baseline + pad))
+        left = min(e[0] for e in extents)
+        top = min(e[1] for e in extents)
+        right = max(e[2] for e in extents)
+        bottom = max(e[3] for e in extents)
+        
+        # // [RENDER]: Text on black == color premultiplied by its anti-aliased coverage
+        sprite = np.zeros((bottom - top, right - left, 3), dtype=np.uint8)
+        alpha = np.zeros((bottom - top, right - left), dtype=np.uint8)
+        for text, (x, y), scale, color, thickness in lines:
+            cv2.putText(sprite, text, (x - left, y - top), self.FONT, scale, color, thickness)
+            cv2.putText(alpha, text, (x - left, y - top), self.FONT, scale, 255, thickness)
+        
+        return {
+            "sprite": sprite,
+            "inverse_alpha": cv2.merge([255 - alpha] * 3),
+            "x": left,
+            "y": top,
+        }
+    
+    @staticmethod
+    def _blend_hud_layer(frame, layer: Dict) -> None:
+        """Alpha-blend a HUD layer onto the frame in place, clipped to its bounds"""
+        h, w = frame.shape[:2]
+        sprite = layer["sprite"]
+        x, y = layer["x"], layer["y"]
+        sh, sw = sprite.shape[:2]
+        fx1, fy1 = max(0, x), max(0, y)
+        fx2, fy2 = min(w, x + sw), min(h, y + sh)
+        if fx1 >= fx2 or fy1 >= fy2:
+            return
+        sx1, sy1 = fx1 - x, fy1 - y
+        sx2, sy2 = sx1 + fx2 - fx1, sy1 + fy2 - fy1
+        
+        # // [BLEND]: frame * (1 - alpha) + premultiplied sprite
+        roi = frame[fy1:fy2, fx1:fx2]
+        faded = cv2.multiply(roi, layer["inverse_alpha"][sy1:sy2, sx1:sx2], scale=1 / 255)
+        cv2.add(faded, sprite[sy1:sy2, sx1:sx2], dst=roi)
+    
+    def _identify_persons(self, frame, xyxy: np.ndarray, pending: np.ndarray) -> List[Tuple[str, float, bool]]:
+        """
+        Detect every face in the full frame once, then embed + match the faces owned
+        by pending persons as one batch (entries for other persons stay UNKNOWN)
+        """
+        identities = [("UNKNOWN", 0.0, False)] * len(xyxy)
+        try:
+            boxes, landmarks = self.face_db.detect_faces(frame)
+            if len(boxes) == 0:
+                return identities
             
-            # // [IDENTIFY]: Use DeepFace to match against known faces
-            return self.face_db.identify_face(head_crop)
+            # // [ASSIGN]: Face centre -> tightest enclosing person box; largest face wins per person
+            areas = (xyxy[:, 2] - xyxy[:, 0]) * (xyxy[:, 3] - xyxy[:, 1])
+            cx = (boxes[:, 0:1] + boxes[:, 2:3]) / 2
+            cy = (boxes[:, 1:2] + boxes[:, 3:4]) / 2
+            inside = (xyxy[:, 0] <= cx) & (cx <= xyxy[:, 2]) & (xyxy[:, 1] <= cy) & (cy <= xyxy[:, 3])
+            owners = np.argmin(np.where(inside, areas, np.inf), axis=1)
+            face_areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+            owned: Dict[int, int] = {}
+            for face in np.argsort(-face_areas).tolist():
+                if inside[face].any():
+                    owned.setdefault(int(owners[face]), face)
+            owned = {owner: face for owner, face in owned.items() if pending[owner]}
+            if not owned:
+                return identities
             
+            # // [BATCH]: One embedder forward + one gallery search for every owned face
+            faces = list(owned.values())
+            embeddings = self.face_db.embed_faces(
+                frame, boxes[faces], None if landmarks is None else landmarks[faces]
+            )
         except Exception as e:
             print(f"[IDENTIFY] Error: {e}")
-            return ("ERROR", 0.0, False)
+            return [("ERROR", 0.0, False)] * len(xyxy)
+        
+        for owner, identity in zip(owned.keys(), self.face_db.match_many(embeddings)):
+            identities[owner] = identity
+        return identities
     
-    def _run_detection(self, frame) -> List[Dict]:
-        """Run YOLOv8 detection + facial recognition"""
-        results = self.model(frame, verbose=False)
+    def _parse_detections(self, frame, boxes: np.ndarray, run_face_recognition: bool) -> List[Dict]:
+        """Extract person detections from one frame's (N, 6) box array, attaching identities"""
         detections = []
+        if len(boxes) == 0:
+            self.tracker.update(np.empty((0, 4), dtype=np.int32))  # Age out every track
+            return detections
         
-        self.face_frame_count += 1
-        run_face_recognition = (self.face_frame_count % self.FACE_SKIP_FRAMES == 0)
+        # // [POSTPROCESS]: One fused filter pass over the [x1, y1, x2, y2, conf, cls] rows
+        xyxy, conf = filter_persons(boxes[:, :4], boxes[:, 5], boxes[:, 4], self.PERSON_CLASS_ID)
         
-        for result in results:
-            boxes = result.boxes
-            if boxes is None:
-                continue
-                
-            for box in boxes:
-                cls = int(box.cls[0])
-                if cls == self.PERSON_CLASS_ID:
-                    x1, y1, x2, y2 = map(int, box.xyxy[0])
-                    yolo_confidence = float(box.conf[0])
-                    
-                    # // [CACHE_KEY]: Use bbox center as cache key
-                    cache_key = f"{(x1+x2)//50}_{(y1+y2)//50}"
-                    
-                    if run_face_recognition and DEEPFACE_AVAILABLE and len(self.face_db.known_faces) > 0:
-                        identity, face_conf, is_known = self._identify_person(frame, x1, y1, x2, y2)
-                        self.identity_cache[cache_key] = (identity, face_conf, is_known)
-                    elif cache_key in self.identity_cache:
-                        identity, face_conf, is_known = self.identity_cache[cache_key]
-                    else:
-                        identity, face_conf, is_known = "SCANNING...", 0.0, False
-                    
-                    detections.append({
-                        "bbox": (x1, y1, x2, y2),
-                        "yolo_conf": yolo_confidence,
-                        "identity": identity,
-                        "face_conf": face_conf,
-                        "is_known": is_known
-                    })
+        track_ids = self.tracker.update(xyxy)
+        tracks = [self.tracker.tracks[track_id] for track_id in track_ids]
+        
+        # // [IDENTIFY]: One face pass over the whole frame covers every person; tracks
+        # // confirmed within the window are not re-embedded, so it idles once all are resolved.
+        # // A brand-new track is identified on its first detection instead of waiting its turn
+        new_track = any(track["identity"] is None for track in tracks)
+        if (run_face_recognition or new_track) and FACE_RECOGNITION_AVAILABLE and len(self.face_db.known_faces) > 0:
+            pending = np.array([
+                not (track["confirmed"] and self.frame_count - track["confirmed_at_frame"] < self.CONFIRM_WINDOW_FRAMES)
+                for track in tracks
+            ])
+            if pending.any():
+                identities = self._identify_persons(frame, xyxy, pending)
+                for i in np.flatnonzero(pending).tolist():
+                    self._assign_identity(tracks[i], identities[i])
+        
+        for i, (track_id, track) in enumerate(zip(track_ids, tracks)):
+            x1, y1, x2, y2 = xyxy[i].tolist()
+            yolo_confidence = float(conf[i])
+            identity, face_conf, is_known = track["identity"] or ("SCANNING...", 0.0, False)
+            
+            detections.append({
+                "track_id": track_id,
+                "bbox": (x1, y1, x2, y2),
+                "yolo_conf": yolo_confidence,
+                "identity": identity,
+                "face_conf": face_conf,
+                "is_known": is_known
+            })
         
         return detections
     
-    def process_frame(self, frame):
-        """Process a single frame with detection/recognition/annotation"""
-        self.frame_count += 1
+    def _assign_identity(self, track: Dict, identity: Tuple[str, float, bool]) -> None:
+        """
+        Store a recognition result on a track with hysteresis: confirming needs
+        CONFIRM_CONFIDENCE, staying confirmed only needs another match on the same name
+        """
+        name, confidence, is_known = identity
+        previous = track["identity"]
+        keeps_confirmation = track["confirmed"] and previous is not None and previous[0] == name
+        track["confirmed"] = is_known and (confidence >= self.CONFIRM_CONFIDENCE or keeps_confirmation)
+        if track["confirmed"]:
+            track["confirmed_at_frame"] = self.frame_count
+        track["identity"] = identity
+    
+    def _model_input(self, frames: List, bgr: bool = False):
+        """
+        Pack frames into the preallocated normalized tensor (RGB, or BGR for
+        networks that take OpenCV order). Falls back to the raw frame list
+        when the batch does not fit the buffer.
+        """
+        n = len(frames)
+        if n > self._input_tensor.shape[0] or any(f.shape != self._rgb_buf.shape for f in frames):
+            return frames
         
-        if self.frame_count % self.SKIP_FRAMES == 0:
-            self.last_detections = self._run_detection(frame)
-            
-            if self.last_detections:
-                self.person_detected = True
-                known_names = [d["identity"] for d in self.last_detections if d["is_known"]]
-                self.identified_count = len(known_names)
-                self._log_detection(len(self.last_detections), self.identified_count, known_names)
+        batch = self._input_tensor[:n]
+        for i, frame in enumerate(frames):
+            if bgr:
+                pixels = frame  # Zero-copy view of the frame; the only copy is the uint8->float pack
             else:
-                self.person_detected = False
-                self.identified_count = 0
+                pixels = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+            batch[i].copy_(torch.from_numpy(pixels).permute(2, 0, 1))
+        return batch.div_(255.0)
+    
+    def _infer(self, frames: List) -> List[np.ndarray]:
+        """
+        Run the detector on a batch of frames.
+        Returns one float32 (N, 6) [x1, y1, x2, y2, conf, cls] array per frame.
+        """
+        if self._ov_request is None and self._net is None:
+            # // [PREDICTOR]: TensorRT / ONNX exports go through the ultralytics backend
+            results = self.model(
+                self._model_input(frames),
+                imgsz=(self.FRAME_HEIGHT, self.FRAME_WIDTH),
+                conf=self.CONF_THRESHOLD,
+                iou=self.IOU_THRESHOLD,
+                classes=[self.PERSON_CLASS_ID],
+                device=self.device,
+                verbose=False
+            )
+            return [result.boxes.data.cpu().numpy().astype(np.float32, copy=False) for result in results]
+        
+        # // [FIT]: Raw forwards are pinned to the camera geometry - stretch any odd
+        # // frame onto it and scale its boxes back afterwards
+        size = (self.FRAME_WIDTH, self.FRAME_HEIGHT)
+        fitted = [f if f.shape[1::-1] == size else cv2.resize(f, size) for f in frames]
         
-        for detection in self.last_detections:
-            x1, y1, x2, y2 = detection["bbox"]
-            self._draw_hud_box(frame, x1, y1, x2, y2, detection["identity"], detection["face_conf"], detection["is_known"])
+        if self._ov_request is not None:
+            # // [ZERO_COPY]: The request reads the uint8 BGR frame memory in place and
+            # // its output tensor wraps OpenVINO's buffer
+            pixels = fitted[0][None] if len(fitted) == 1 else np.stack(fitted)
+            self._ov_request.infer({0: pixels}, share_inputs=True, share_outputs=True)
+            prediction = torch.from_numpy(self._ov_request.get_output_tensor(0).data)
+        else:
+            # // [FORWARD]: Straight through the fused network - no predictor, no Results objects
+            batch = self._model_input(fitted, bgr=True)
+            with torch.inference_mode():
+                prediction = self._net(batch.to(self.device, dtype=self._net_dtype, non_blocking=True))
+        
+        detections = non_max_suppression(
+            prediction, self.CONF_THRESHOLD, self.IOU_THRESHOLD, classes=[self.PERSON_CLASS_ID]
+        )
         
+        boxes = []
+        for frame, det in zip(frames, detections):
+            det = det.float().cpu().numpy()
+            h, w = frame.shape[:2]
+            if (w, h) != size:
+                det[:, [0, 2]] *= w / self.FRAME_WIDTH
+                det[:, [1, 3]] *= h / self.FRAME_HEIGHT
+            
+            # // [CLIP]: Keep boxes inside the frame, as the ultralytics predictor does
+            np.clip(det[:, 0:4:2], 0, w, out=det[:, 0:4:2])
+            np.clip(det[:, 1:4:2], 0, h, out=det[:, 1:4:2])
+            boxes.append(det)
+        return boxes
+    
+    def _run_detection(self, frame) -> List[Dict]:
+        """
+        Run YOLOv8 detection + facial recognition when due. The schedule counts stream
+        frames, not detector runs - those are motion-gated and sparse on a still scene
+        """
+        boxes = self._infer([frame])[0]
+        
+        run_face_recognition = self.frame_count - self._last_face_frame >= self.FACE_SKIP_FRAMES * self.skip_frames
+        if run_face_recognition:
+            self._last_face_frame = self.frame_count
+        return self._parse_detections(frame, boxes, run_face_recognition)
+    
+    def _update_detection_state(self, detections: List[Dict]) -> None:
+        """Publish detections as the current scene state"""
+        # // [SIGNATURE]: What the HUD shows for these detections (ignores YOLO jitter)
+        detection_key = tuple(
+            (d["bbox"], d["identity"], d["is_known"], int(d["face_conf"] * 100))
+            for d in detections
+        )
+        with self._lock:
+            self.last_detections = detections
+            self.person_detected = bool(detections)
+            self.identified_count = sum(1 for d in detections if d["is_known"])
+            self._detection_key = detection_key
+    
+    def _detector_loop(self) -> None:
+        """
+        // [WORKER]: Detect + identify the freshest submitted frame, then swap in
+        // the results; frames submitted while busy replace each other unseen
+        """
+        while True:
+            frame = self._detect_queue.get()
+            if frame is None:
+                return
+            try:
+                detections = self._run_detection(frame)
+            except Exception as e:
+                print(f"[DETECTOR] Error: {e}")
+                continue
+            finally:
+                self._detect_buffers.append(frame)
+            
+            self._update_detection_state(detections)
+            if detections:
+                known_names = [d["identity"] for d in detections if d["is_known"]]
+                self._log_detection(len(detections), len(known_names), known_names)
+    
+    def _submit_detection(self, frame: Optional[np.ndarray]) -> None:
+        """Queue a copy of the frame for the detector (None stops it), dropping any stale one"""
+        # // [RECYCLE]: A stale queued frame's buffer is overwritten with the fresh one
+        try:
+            buffer = self._detect_queue.get_nowait()
+        except queue.Empty:
+            buffer = self._detect_buffers.pop() if self._detect_buffers else None
+        
+        if frame is not None:
+            if buffer is None or buffer.shape != frame.shape:
+                buffer = np.empty_like(frame)
+            np.copyto(buffer, frame)
+        elif buffer is not None:
+            self._detect_buffers.append(buffer)
+        
+        try:
+            self._detect_queue.put_nowait(buffer if frame is not None else None)
+        except queue.Full:
+            pass  # Another producer got there first - its frame is just as fresh
+    
+    def _annotate(self, frame, detections: List[Dict]):
+        """Draw detections and the HUD overlay onto a frame"""
+        self._draw_hud_boxes(frame, detections)
         self._draw_hud_overlay(frame)
         return frame
     
-    def generate_frames(self) -> Generator[bytes, None, None]:
-        """Generator yielding JPEG-encoded frames for MJPEG streaming"""
+    def _scene_changed(self, frame) -> bool:
+        """
+        // [MOTION]: Mean abs grey-level difference against the frame last sent
+        // to the detector (slow drift accumulates until it crosses the threshold)
+        """
+        thumb = self._motion_thumb(frame)
+        if (
+            self._motion_reference is not None
+            and self._frames_since_detection < self.MOTION_REFRESH_FRAMES
+            and cv2.absdiff(thumb, self._motion_reference).mean() <= self.MOTION_THRESHOLD
+        ):
+            return False
+        self._motion_reference = thumb
+        return True
+    
+    def _step_batch(self, frames: List) -> Iterator:
+        """
+        Advance the frame counter through consecutive frames, handing a frame to
+        the detector thread at most every Nth frame - and only when the scene
+        moved (or MOTION_REFRESH_FRAMES passed). Never waits for detection.
+        """
+        for frame in frames:
+            self.frame_count += 1
+            self._frames_since_detection += 1
+            if self._frames_since_detection >= self.skip_frames and self._scene_changed(frame):
+                self._submit_detection(frame)
+                self._frames_since_detection = 0
+            yield frame
+    
+    def process_batch(self, frames: List) -> List:
+        """Annotate consecutive frames with the latest detections (detection runs in the background)"""
+        detections = self.last_detections
+        return [self._annotate(frame, detections) for frame in self._step_batch(frames)]
+    
+    def _motion_thumb(self, frame) -> np.ndarray:
+        """Grey MOTION_THUMB_SIZE copy of a frame - area averaging also averages out sensor noise"""
+        return cv2.cvtColor(
+            cv2.resize(frame, self.MOTION_THUMB_SIZE, interpolation=cv2.INTER_AREA), cv2.COLOR_BGR2GRAY
+        )
+    
+    def _render_jpeg(self, frame) -> bytes:
+        """
+        Annotate + encode a frame, or - on an empty scene only - reuse the previous
+        JPEG when the HUD clock has not ticked and no thumbnail pixel moved more than
+        RENDER_REUSE_THRESHOLD from the encoded frame (the FRAME counter then
+        refreshes with the clock)
+        """
+        with self._lock:
+            detections, detection_key = self.last_detections, self._detection_key
+            person_detected = self.person_detected
+        key = (int(time.time()), detection_key, len(self.face_db.known_faces))
+        thumb = self._motion_thumb(frame)
+        
+        # // [STATIC]: Never freeze a feed with people in it; per-pixel max so a
+        # // small moving object is not averaged away by the rest of the frame
+        if (
+            not person_detected
+            and key == self._render_key
+            and self._render_jpeg_bytes is not None
+            and cv2.absdiff(thumb, self._render_reference).max() <= self.RENDER_REUSE_THRESHOLD
+        ):
+            return self._render_jpeg_bytes
+        
+        jpeg = self._encode_jpeg(self._annotate(frame, detections))
+        self._render_key = key
+        self._render_reference = thumb
+        self._render_jpeg_bytes = jpeg
+        return jpeg
+    
+    def process_frame(self, frame):
+        """Annotate a single frame with the latest detections"""
+        return self.process_batch([frame])[0]
+    
+    def _open_camera(self) -> cv2.VideoCapture:
+        """Open and configure the capture device"""
+        cap = cv2.VideoCapture(self.camera_index)
+        
+        if not cap.isOpened():
+            raise RuntimeError(f"[CRITICAL] Failed to open camera {self.camera_index}")
+        
+        # // [FORMAT]: Ask the camera for MJPEG instead of raw YUYV (less bus bandwidth)
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.FRAME_WIDTH)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.FRAME_HEIGHT)
+        cap.set(cv2.CAP_PROP_FPS, 30)
+        
+        # // [LATENCY]: Keep at most one frame queued inside the driver/backend
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        return cap
+    
+    def _capture_loop(self) -> None:
+        """
+        // [PRODUCER]: Read frames at the camera's native rate into the ring buffer
+        """
         try:
-            self.cap = cv2.VideoCapture(self.camera_index)
-            
-            if not self.cap.isOpened():
-                raise RuntimeError(f"[CRITICAL] Failed to open camera {self.camera_index}")
-            
-            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-            self.cap.set(cv2.CAP_PROP_FPS, 30)
-            
-            print(f"[GODS_EYE] Camera {self.camera_index} initialized successfully")
+            self.cap = self._open_camera()
+        except Exception as e:
+            print(e)
+            return
+        
+        print(f"[GODS_EYE] Camera {self.camera_index} initialized successfully")
+        
+        while self._capture_running:
+            # // [GRAB]: Always pull the frame off the device. If the consumer has
+            # // fallen behind, the oldest buffered frame is stale - recycle its slot
+            # // so what we stream is never more than buffer_size frames old
+            if not self.cap.grab():
+                continue
+            with self._frame_lock:
+                if len(self._frame_buffer) == self._frame_buffer.maxlen:
+                    self._free_slots.append(self._frame_buffer.popleft())
+                slot = self._free_slots.pop() if self._free_slots else None
+            if slot is None:
+                continue
             
-            while True:
-                success, frame = self.cap.read()
-                
+            # // [DECODE]: Straight into a preallocated slot (OpenCV reallocates
+            # // only if the camera delivers a different geometry)
+            success, frame = self.cap.retrieve(slot)
+            with self._frame_lock:
                 if not success:
+                    self._free_slots.append(slot)
                     continue
-                
-                processed_frame = self.process_frame(frame)
-                _, buffer = cv2.imencode('.jpg', processed_frame, [cv2.IMWRITE_JPEG_QUALITY, 80])
-                frame_bytes = buffer.tobytes()
-                
-                yield (b'--frame\r\n'
-                       b'Content-Type: image/jpeg\r\n\r\n' + frame_bytes + b'\r\n')
-                       
-        except Exception as e:
-            print(f"[CRITICAL] Vision Engine error: {e}")
-            raise
+                self._frame_buffer.append(frame)
+                self._frame_ready.set()
+    
+    def _drain_frames(self) -> List:
+        """
+        // [CONSUMER]: Take the newest buffered frame; anything older is stale
+        // by now and goes straight back to the capture thread as a free slot
+        """
+        with self._frame_lock:
+            if not self._frame_buffer:
+                return []
+            frames = [self._frame_buffer.pop()]
+            self._free_slots.extend(self._frame_buffer)
+            self._frame_buffer.clear()
+            self._frame_ready.clear()
+            return frames
+    
+    def _release_frames(self, frames: List) -> None:
+        """
+        // [RECYCLE]: Hand consumed frames back to the capture thread as free slots
+        """
+        with self._frame_lock:
+            self._free_slots.extend(frames[:self._slot_count - len(self._free_slots)])
+    
+    def _encode_jpeg(self, frame) -> bytes:
+        """JPEG-encode a BGR frame, preferring the libjpeg-turbo SIMD path"""
+        if self._jpeg is not None:
+            # // [PREALLOC]: Encode into a reused worst-case-sized buffer
+            required = self._jpeg.buffer_size(frame, jpeg_subsample=TJSAMP_420)
+            if self._jpeg_buf is None or self._jpeg_buf.size < required:
+                self._jpeg_buf = np.empty(required, dtype=np.uint8)
+            
+            jpeg, size = self._jpeg.encode(
+                frame, quality=self.JPEG_QUALITY, pixel_format=TJPF_BGR,
+                jpeg_subsample=TJSAMP_420,  # Same chroma subsampling cv2.imencode uses
+                dst=self._jpeg_buf
+            )
+            return bytes(jpeg[:size])
+        
+        _, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, self.JPEG_QUALITY])
+        return buffer.tobytes()
+    
+    def read_jpeg_batch(self, timeout: float = 1.0) -> List[bytes]:
+        """
+        Block until a frame is captured, then annotate and JPEG-encode the newest one.
+        Returns an empty list if nothing arrived within the timeout.
+        """
+        frames = self._drain_frames()
+        deadline = time.monotonic() + timeout
+        while not frames:
+            if not self._capture_thread.is_alive():
+                raise RuntimeError(f"[CRITICAL] Camera {self.camera_index} capture stopped")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return []
+            self._frame_ready.wait(min(remaining, 0.1))
+            frames = self._drain_frames()
+        
+        # // [SERIALIZE]: One batch through annotation + encoding at a time, whichever client asks
+        try:
+            with self._pipeline_lock:
+                return [self._render_jpeg(frame) for frame in self._step_batch(frames)]
         finally:
-            if self.cap is not None:
-                self.cap.release()
-                print("[GODS_EYE] Camera released successfully")
+            self._release_frames(frames)
+    
+    def generate_frames(self) -> AsyncGenerator[bytes, None]:
+        """Async MJPEG stream of this engine, inference pinned to its worker thread"""
+        return mjpeg_stream(self, self._inference_executor)
+    
+    def list_faces(self) -> List[str]:
+        # // Every stored image, including ones without a usable embedding, so they can still be deleted
+        return list(self.face_db.face_files.keys())
+    
+    def get_face_path(self, name: str) -> Optional[str]:
+        return self.face_db.face_files.get(name)
     
     def get_logs(self, limit: int = 50) -> List[dict]:
-        with self._lock:
-            return self.detection_logs[-limit:]
+        if limit <= self.LOG_MEMORY_ROWS:
+            # // [FAST_PATH]: Newest `limit` rows straight from the in-memory tail
+            with self._lock:
+                start = max(0, len(self._recent_logs) - limit)
+                rows = list(itertools.islice(self._recent_logs, start, None))
+        else:
+            # // [FLUSH]: Let the writer commit every queued row so the disk read is complete
+            if self._log_thread.is_alive():
+                flushed = threading.Event()
+                self._log_queue.put(flushed)
+                flushed.wait(timeout=1.0)
+            rows = self._read_log_rows(limit)
+        
+        return [
+            {
+                "timestamp": datetime.fromtimestamp(timestamp_ns / 1e9).isoformat(),
+                "num_persons": num_persons,
+                "identified": identified,
+                "names": list(names)
+            }
+            for timestamp_ns, num_persons, identified, names in rows
+        ]
     
     def get_status(self) -> dict:
+        # // Report the recognition backend that actually loaded, not just what imported
+        backend = self.face_db.backend or ""
         return {
             "person_detected": self.person_detected,
             "identified_count": self.identified_count,
             "frame_count": self.frame_count,
             "detections_count": len(self.last_detections),
             "known_faces_loaded": len(self.face_db.known_faces),
-            "deepface_available": DEEPFACE_AVAILABLE
+            "face_backend": self.face_db.backend,
+            "deepface_available": backend.startswith("deepface"),
+            "insightface_available": backend == "insightface",
+            "gpu_available": GPU_AVAILABLE
         }
     
     def cleanup(self) -> None:
+        self._capture_running = False
+        self._capture_thread.join(timeout=2.0)
+        self._inference_executor.shutdown(wait=True, cancel_futures=True)
+        self._submit_detection(None)
+        self._detector_thread.join(timeout=5.0)
+        self._log_queue.put(None)
+        self._log_thread.join(timeout=5.0)
+        with self._db_lock:
+            self._db.commit()
+            self._db.close()
         if self.cap is not None and self.cap.isOpened():
             self.cap.release()
             print("[GODS_EYE] Vision Engine shutdown complete")
@@ -48,6 +48,10 @@ function FaceManager() {
 
   useEffect(() => {
     fetchFaces();
+
+    // // [POLL]: Uploads are registered by a background reload (202 Accepted)
+    const facesInterval = setInterval(fetchFaces, POLL_INTERVAL);
+    return () => clearInterval(facesInterval);
   }, [fetchFaces]);
 
   const handleUpload = async (e: React.ChangeEvent<HTMLInputElement>) => {